@@ -13,7 +13,8 @@ Usage:
         print(summary)
 """
 
-from .agent import BrowserAgent
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     AgentBrowserError,
     BrowserNotStartedError,
@@ -25,6 +26,9 @@ from .exceptions import (
     TimeoutError,
 )
 
+if TYPE_CHECKING:
+    from .agent import BrowserAgent
+
 __version__ = "0.1.0"
 __all__ = [
     "BrowserAgent",
@@ -37,3 +41,12 @@ __all__ = [
     "RecordingError",
     "TimeoutError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # BrowserAgent pulls in Playwright; import it only when first accessed.
+    if name == "BrowserAgent":
+        from .agent import BrowserAgent
+
+        return BrowserAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,89 @@
+"""Shared browser pool — one launched browser, many cheap contexts."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from typing import TYPE_CHECKING, Any
+
+from playwright.async_api import async_playwright
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+    from .config import BrowserConfig
+
+
+class BrowserPool:
+    """Keeps browsers alive across BrowserAgent instances and hands out contexts.
+
+    A browser is launched lazily per (browser_type, headless, slow_mo) on
+    first use; every agent after that only pays for a new context. Playwright
+    objects are bound to the event loop that created them, so the pool starts
+    afresh when used from a different loop.
+    """
+
+    def __init__(self) -> None:
+        self._playwright: Playwright | None = None
+        self._browsers: dict[tuple[str, bool, int], Browser] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def get_context(self, config: BrowserConfig, **options: Any) -> BrowserContext:
+        """Create a new context on the shared browser matching ``config``."""
+        browser = await self._get_browser(config)
+        return await browser.new_context(**options)
+
+    async def _get_browser(self, config: BrowserConfig) -> Browser:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Objects created on a previous loop can't be used from this one.
+            self._playwright = None
+            self._browsers = {}
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        assert self._lock is not None
+
+        async with self._lock:
+            key = (config.browser_type, config.headless, config.slow_mo)
+            browser = self._browsers.get(key)
+            if browser is None or not browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                launcher = getattr(self._playwright, config.browser_type)
+                browser = await launcher.launch(
+                    headless=config.headless,
+                    slow_mo=config.slow_mo,
+                )
+                self._browsers[key] = browser
+            return browser
+
+    async def close(self) -> None:
+        """Close every shared browser and stop Playwright."""
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browsers = {}
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def _close_at_exit(self) -> None:
+        # Only possible if the owning loop is still usable. When it was closed
+        # (e.g. by asyncio.run), the driver exits along with the interpreter.
+        loop = self._loop
+        if loop is None or loop.is_closed() or loop.is_running():
+            return
+        try:
+            loop.run_until_complete(self.close())
+        except Exception:
+            pass
+
+
+shared_pool = BrowserPool()
+atexit.register(shared_pool._close_at_exit)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import random
+from typing import TYPE_CHECKING, Any
 
 from .config import RetryConfig, StealthConfig
 from .elements import FoundElement, find_element
@@ -14,20 +15,41 @@ if TYPE_CHECKING:
     from playwright.async_api import Page
 
 
+# Scroll offset is passed as an argument so the script text never changes
+# and the page can reuse its compiled form.
+_SCROLL_JS = "(y) => window.scrollBy(0, y)"
+
+# Adds a <link rel="preconnect"> hint so the browser opens the connection
+# (DNS, TCP, TLS) to an origin ahead of navigating to it.
+_PRECONNECT_JS = """(origin) => {
+    const link = document.createElement('link');
+    link.rel = 'preconnect';
+    link.href = origin;
+    (document.head || document.documentElement).appendChild(link);
+}"""
+
+# Strong references to fire-and-forget scroll tasks until they finish.
+_background: set[asyncio.Task[Any]] = set()
+
+
 async def _with_retry(
     page: Page,
     query: str,
     config: RetryConfig,
 ) -> FoundElement:
-    """Find an element with retries."""
+    """Find an element with retries, backing off exponentially with jitter."""
     last_err: Exception | None = None
     for attempt in range(config.max_retries):
+        # Only the final attempt pays for listing alternatives in the error.
+        final = attempt == config.max_retries - 1
         try:
-            return await find_element(page, query, config)
+            return await find_element(page, query, config, verbose=final)
         except ElementNotFoundError as e:
             last_err = e
-            if attempt < config.max_retries - 1:
-                await asyncio.sleep(config.retry_delay_ms / 1000.0)
+            if not final:
+                delay_ms = min(config.max_retry_delay_ms, config.retry_delay_ms * (2 ** attempt))
+                delay_ms *= 1 + random.random() * config.jitter
+                await asyncio.sleep(delay_ms / 1000.0)
     raise last_err  # type: ignore[misc]
 
 
@@ -53,7 +75,8 @@ async def click(
     """
     el = await _with_retry(page, query, retry)
     await el.locator.click(timeout=timeout_ms)
-    await random_delay(stealth)
+    if stealth.enabled:
+        await random_delay(stealth)
     return el
 
 
@@ -84,19 +107,21 @@ async def type_text(
         The element that was typed into.
     """
     el = await _with_retry(page, query, retry)
-    if clear:
-        await el.locator.clear(timeout=timeout_ms)
     if stealth.realistic_typing:
+        if clear:
+            await el.locator.clear(timeout=timeout_ms)
         await el.locator.press_sequentially(
             text,
             delay=stealth.typing_delay_min_ms,
             timeout=timeout_ms,
         )
     else:
+        # fill() replaces the current value itself — no separate clear needed.
         await el.locator.fill(text, timeout=timeout_ms)
     if submit:
         await el.locator.press("Enter")
-    await random_delay(stealth)
+    if stealth.enabled:
+        await random_delay(stealth)
     return el
 
 
@@ -111,7 +136,8 @@ async def hover(
     """Hover over an element found by query."""
     el = await _with_retry(page, query, retry)
     await el.locator.hover(timeout=timeout_ms)
-    await random_delay(stealth)
+    if stealth.enabled:
+        await random_delay(stealth)
     return el
 
 
@@ -127,18 +153,48 @@ async def select_option(
     """Select a dropdown option by visible text or value."""
     el = await _with_retry(page, query, retry)
     await el.locator.select_option(label=value, timeout=timeout_ms)
-    await random_delay(stealth)
+    if stealth.enabled:
+        await random_delay(stealth)
     return el
 
 
-async def scroll_down(page: Page, pixels: int = 500) -> None:
-    """Scroll down by a number of pixels."""
-    await page.evaluate(f"window.scrollBy(0, {pixels})")
+async def _scroll(page: Page, dy: int, wait: bool) -> None:
+    if wait:
+        await page.evaluate(_SCROLL_JS, dy)
+        return
+    task = asyncio.create_task(page.evaluate(_SCROLL_JS, dy))
+    _background.add(task)
+    task.add_done_callback(_forget)
+    # One loop hop lets the task send its message, so later calls on the
+    # page are still ordered after the scroll; only the reply isn't awaited.
+    await asyncio.sleep(0)
+
 
+def _forget(task: asyncio.Task[Any]) -> None:
+    _background.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieved; a failed fire-and-forget scroll is ignored
+
+
+async def scroll_down(page: Page, pixels: int = 500, *, wait: bool = True) -> None:
+    """Scroll down by a number of pixels.
+
+    With wait=False the scroll is sent without waiting for the page's reply.
+    """
+    await _scroll(page, pixels, wait)
 
-async def scroll_up(page: Page, pixels: int = 500) -> None:
-    """Scroll up by a number of pixels."""
-    await page.evaluate(f"window.scrollBy(0, -{pixels})")
+
+async def scroll_up(page: Page, pixels: int = 500, *, wait: bool = True) -> None:
+    """Scroll up by a number of pixels.
+
+    With wait=False the scroll is sent without waiting for the page's reply.
+    """
+    await _scroll(page, -pixels, wait)
+
+
+async def preconnect(page: Page, origin: str) -> None:
+    """Ask the browser to warm up a connection to an origin (scheme://host[:port])."""
+    await page.evaluate(_PRECONNECT_JS, origin)
 
 
 async def scroll_to_element(
@@ -151,7 +207,8 @@ async def scroll_to_element(
     """Scroll to an element found by query."""
     el = await _with_retry(page, query, retry)
     await el.locator.scroll_into_view_if_needed()
-    await random_delay(stealth)
+    if stealth.enabled:
+        await random_delay(stealth)
     return el
 
 
@@ -161,10 +218,13 @@ async def wait_for_text(
     *,
     timeout_ms: int = 30000,
 ) -> None:
-    """Wait for specific text to appear on the page."""
+    """Wait for specific text to appear on the page.
+
+    The locator is built once and handed to Playwright, which does the
+    polling driver-side; no Python work happens per poll.
+    """
+    loc = page.get_by_text(text).first
     try:
-        await page.get_by_text(text).first.wait_for(
-            state="visible", timeout=timeout_ms
-        )
+        await loc.wait_for(state="visible", timeout=timeout_ms)
     except Exception as e:
         raise TimeoutError(f"wait_for_text('{text}')", timeout_ms) from e
@@ -14,22 +14,43 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
+import inspect
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlsplit
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from . import actions as act
 from .browser import BrowserManager
-from .config import AgentConfig, BrowserConfig, RetryConfig, StealthConfig
-from .exceptions import BrowserNotStartedError, NavigationError
-from .extraction import Link, TableData, get_links, get_tables, get_visible_text, get_meta
+from .config import AgentConfig, BrowserConfig, RetryConfig, StealthConfig, _default_data_dir
+from .exceptions import AgentBrowserError, BrowserNotStartedError, NavigationError
+from .extraction import Link, TableData, get_all, get_links, get_tables, get_visible_text, get_meta
 from .forms import DetectedForm, detect_forms, fill_form as _fill_form
-from .page_state import page_summary as _page_summary
-from .profiles import load_context_profile, save_context_profile
+from .page_state import invalidate_summary, page_summary as _page_summary
+from .profiles import load_context_profile, profile_storage_state, save_context_profile
 from .recorder import ActionRecorder, RecordedAction
-from .screenshot import take_screenshot
 from .stealth import random_delay
 from .storage import Storage
 
+# How long goto(wait_until=None) waits before handing control back.
+_NO_WAIT_GOTO_TIMEOUT_MS = 100
+
+# Actions accepted by BrowserAgent.batch, keyed by BrowserAgent method name so
+# batched steps are recorded (and replayed) exactly like direct calls.
+# The flag marks actions that locate an element and take retry/stealth config.
+_BATCH_ACTIONS: dict[str, tuple[Callable[..., Awaitable[Any]], bool]] = {
+    "click": (act.click, True),
+    "type": (act.type_text, True),
+    "hover": (act.hover, True),
+    "select": (act.select_option, True),
+    "scroll_to": (act.scroll_to_element, True),
+    "scroll_down": (act.scroll_down, False),
+    "scroll_up": (act.scroll_up, False),
+}
+
 
 class BrowserAgent:
     """High-level browser agent for AI-driven web interaction.
@@ -42,6 +63,8 @@ class BrowserAgent:
         timeout_ms: Default timeout in milliseconds.
         viewport: Tuple of (width, height) for the viewport.
         data_dir: Directory for storing profiles, recordings, etc.
+        share_browser: Reuse one browser process across agents, giving each
+            agent its own context (default: False).
     """
 
     def __init__(
@@ -54,6 +77,7 @@ class BrowserAgent:
         timeout_ms: int = 30000,
         viewport: tuple[int, int] = (1920, 1080),
         data_dir: str | Path | None = None,
+        share_browser: bool = False,
     ) -> None:
         bc = BrowserConfig(
             headless=headless,
@@ -62,35 +86,47 @@ class BrowserAgent:
             viewport_height=viewport[1],
             timeout_ms=timeout_ms,
             stealth=stealth,
+            share_browser=share_browser,
         )
         sc = StealthConfig(enabled=stealth)
         self._config = AgentConfig(
             browser=bc,
             stealth=sc,
             profile=profile,
+            data_dir=Path(data_dir) if data_dir else _default_data_dir(),
         )
-        if data_dir:
-            self._config.data_dir = Path(data_dir)
         self._config.ensure_dirs()
 
         self._manager = BrowserManager(self._config)
         self._storage = Storage(self._config.data_dir / "agentbrowser.db")
         self._recorder = ActionRecorder()
         self._started = False
+        self._preconnected: set[str] = set()
+
+        # Public methods by name, flagged if they are coroutines — for replay.
+        # Built from the class so properties like `page` aren't evaluated.
+        self._dispatch: dict[str, tuple[Callable[..., Any], bool]] = {
+            name: (getattr(self, name), asyncio.iscoroutinefunction(fn))
+            for name, fn in inspect.getmembers(type(self), inspect.isfunction)
+            if not name.startswith("_")
+        }
 
     # --- Lifecycle ---
 
     async def start(self) -> None:
         """Start the browser. Called automatically by async context manager."""
-        await self._manager.start()
+        # A profile in storage_state form is applied as the context is
+        # created; older profiles are loaded into the open page afterwards.
+        profile = self._config.profile
+        state = profile_storage_state(profile, self._storage) if profile else None
+        await self._manager.start(storage_state=state)
         self._started = True
 
-        # Load profile if specified
-        if self._config.profile:
+        if profile and state is None:
             await load_context_profile(
                 self._manager.context,
                 self._manager.page,
-                self._config.profile,
+                profile,
                 self._storage,
             )
 
@@ -111,6 +147,10 @@ class BrowserAgent:
         if not self._started:
             raise BrowserNotStartedError()
 
+    def _page_changing(self) -> None:
+        """Drop the cached page_summary before an action that may change the page."""
+        invalidate_summary(self._manager.page)
+
     @property
     def page(self):
         """The current Playwright page."""
@@ -133,37 +173,71 @@ class BrowserAgent:
 
     # --- Navigation ---
 
-    async def goto(self, url: str, *, wait_until: str = "domcontentloaded") -> None:
+    async def goto(self, url: str, *, wait_until: str | None = "domcontentloaded") -> None:
         """Navigate to a URL.
 
         Args:
             url: The URL to navigate to.
             wait_until: When to consider navigation complete.
                 Options: "domcontentloaded", "load", "networkidle", "commit".
+                Pass None to start the navigation and return almost
+                immediately, letting the page load in the background —
+                useful for scrapers that wait for content anyway
+                (e.g. with wait_for) before reading it.
         """
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("goto", url=url)
         try:
-            await self.page.goto(url, wait_until=wait_until, timeout=self._config.browser.timeout_ms)
+            if wait_until is None:
+                try:
+                    await self.page.goto(url, wait_until="commit", timeout=_NO_WAIT_GOTO_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    pass  # navigation keeps going in the background
+            else:
+                await self.page.goto(url, wait_until=wait_until, timeout=self._config.browser.timeout_ms)
         except Exception as e:
             raise NavigationError(url, str(e)) from e
-        await random_delay(self._config.stealth)
+        if self._config.stealth.enabled:
+            await random_delay(self._config.stealth)
+
+    async def preconnect(self, url: str) -> None:
+        """Warm up DNS/TCP/TLS for a URL's host before navigating to it.
+
+        Adds a preconnect hint to the current page, so the connection is set
+        up while your code does other work — e.g. call it for the next page
+        of a crawl while still extracting the current one. Only http(s)
+        origins are handled, once per origin per agent.
+        """
+        self._ensure_started()
+        self._page_changing()
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            return
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin in self._preconnected:
+            return
+        self._preconnected.add(origin)
+        await act.preconnect(self.page, origin)
 
     async def back(self) -> None:
         """Navigate back."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("back")
         await self.page.go_back(timeout=self._config.browser.timeout_ms)
 
     async def forward(self) -> None:
         """Navigate forward."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("forward")
         await self.page.go_forward(timeout=self._config.browser.timeout_ms)
 
     async def refresh(self) -> None:
         """Refresh the current page."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("refresh")
         await self.page.reload(timeout=self._config.browser.timeout_ms)
 
@@ -182,6 +256,7 @@ class BrowserAgent:
             ElementNotFoundError: With list of available elements.
         """
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("click", query=query)
         await act.click(
             self.page,
@@ -208,6 +283,7 @@ class BrowserAgent:
             submit: Press Enter after typing (default: False).
         """
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("type", query=query, text=text)
         await act.type_text(
             self.page,
@@ -222,6 +298,7 @@ class BrowserAgent:
     async def hover(self, query: str) -> None:
         """Hover over an element found by query."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("hover", query=query)
         await act.hover(
             self.page,
@@ -238,6 +315,7 @@ class BrowserAgent:
             value: The option to select (by visible text).
         """
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("select", query=query, value=value)
         await act.select_option(
             self.page,
@@ -247,23 +325,95 @@ class BrowserAgent:
             stealth=self._config.stealth,
         )
 
+    async def batch(
+        self,
+        steps: list[dict[str, Any]],
+        *,
+        stop_on_error: bool = True,
+    ) -> list[Any]:
+        """Run a sequence of actions in a single call.
+
+        Each step is a dict with an "action" key plus the keyword arguments of
+        the BrowserAgent method of that name, e.g.
+        {"action": "type", "query": "Email", "text": "me@x.com"}.
+        Supported actions: click, type, hover, select, scroll_to, scroll_down,
+        scroll_up. The random stealth delay is skipped between steps unless a
+        step sets "delay": True.
+
+        Args:
+            steps: The actions to run, in order.
+            stop_on_error: Raise on the first failing step (default: True).
+                When False, the exception is stored as that step's result
+                and the batch carries on.
+
+        Returns:
+            One result per step: the FoundElement acted on, None for scrolls,
+            or the exception raised when stop_on_error is False.
+        """
+        self._ensure_started()
+        self._page_changing()
+        page = self.page
+        retry = self._config.retry
+        stealth = self._config.stealth
+        quiet = dataclasses.replace(stealth, enabled=False)
+
+        results: list[Any] = []
+        for step in steps:
+            args = dict(step)
+            name = args.pop("action", None)
+            delay = bool(args.pop("delay", False))
+            try:
+                entry = _BATCH_ACTIONS.get(name)  # type: ignore[arg-type]
+                if entry is None:
+                    raise AgentBrowserError(f"Unknown batch action '{name}'")
+                func, element_action = entry
+                # Only what the BrowserAgent method takes, so replay can pass
+                # the recorded arguments straight back to it.
+                unexpected = args.keys() - _batch_params(name)
+                if unexpected:
+                    raise AgentBrowserError(
+                        f"Unexpected arguments for batch action '{name}': "
+                        + ", ".join(sorted(unexpected))
+                    )
+                self._recorder.record(name, **args)
+                if element_action:
+                    result = await func(
+                        page,
+                        retry=retry,
+                        stealth=stealth if delay else quiet,
+                        **args,
+                    )
+                else:
+                    result = await func(page, wait=stealth.enabled, **args)
+                    if delay and stealth.enabled:
+                        await random_delay(stealth)
+            except Exception as e:
+                if stop_on_error:
+                    raise
+                result = e
+            results.append(result)
+        return results
+
     # --- Scrolling ---
 
     async def scroll_down(self, pixels: int = 500) -> None:
         """Scroll down by pixels."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("scroll_down", pixels=pixels)
-        await act.scroll_down(self.page, pixels)
+        await act.scroll_down(self.page, pixels, wait=self._config.stealth.enabled)
 
     async def scroll_up(self, pixels: int = 500) -> None:
         """Scroll up by pixels."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("scroll_up", pixels=pixels)
-        await act.scroll_up(self.page, pixels)
+        await act.scroll_up(self.page, pixels, wait=self._config.stealth.enabled)
 
     async def scroll_to(self, query: str) -> None:
         """Scroll to an element found by query."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("scroll_to", query=query)
         await act.scroll_to_element(
             self.page,
@@ -282,6 +432,7 @@ class BrowserAgent:
             timeout_ms: Maximum wait time in milliseconds.
         """
         self._ensure_started()
+        self._page_changing()
         await act.wait_for_text(
             self.page,
             text,
@@ -290,14 +441,16 @@ class BrowserAgent:
 
     async def wait(self, ms: int) -> None:
         """Wait for a fixed duration (use sparingly)."""
+        if self._started:
+            self._page_changing()
         await asyncio.sleep(ms / 1000.0)
 
     # --- Content Extraction ---
 
-    async def get_text(self) -> str:
-        """Get all visible text from the page."""
+    async def get_text(self, max_chars: int | None = 200_000) -> str:
+        """Get all visible text from the page, up to max_chars (None for all)."""
         self._ensure_started()
-        return await get_visible_text(self.page)
+        return await get_visible_text(self.page, max_chars)
 
     async def get_links(self) -> list[Link]:
         """Get all links from the page."""
@@ -314,17 +467,27 @@ class BrowserAgent:
         self._ensure_started()
         return await get_meta(self.page)
 
+    async def get_meta_and_links(self) -> tuple[dict[str, str], list[Link]]:
+        """Get page metadata and all links in a single round-trip."""
+        self._ensure_started()
+        content = await get_all(self.page, tables=False, text=False)
+        return content.meta, content.links
+
     # --- Page Summary ---
 
-    async def page_summary(self, *, max_items: int = 20) -> str:
+    async def page_summary(self, *, max_items: int = 20, fresh: bool = False) -> str:
         """Get an LLM-friendly summary of the current page state.
 
         Returns a structured text description of the page including
         visible elements, forms, navigation, and content preview.
         Perfect for feeding to an AI agent to understand the page.
+
+        The last summary is reused while the page is unchanged. Pass
+        fresh=True after changing the page outside the agent (e.g. through
+        agent.page directly).
         """
         self._ensure_started()
-        return await _page_summary(self.page, max_items=max_items)
+        return await _page_summary(self.page, max_items=max_items, fresh=fresh)
 
     # --- Screenshots ---
 
@@ -334,25 +497,35 @@ class BrowserAgent:
         *,
         full_page: bool = False,
         element: str | None = None,
+        quality: int | None = None,
+        encode: bool = True,
     ) -> str:
         """Take a screenshot.
 
         Args:
-            path: File path to save (optional). Returns base64 either way.
+            path: File path to save (optional).
             full_page: Capture full scrollable page.
             element: Screenshot only this element (by text/selector).
+            quality: Save as JPEG at this quality (1-100) instead of PNG;
+                much smaller for large full-page captures.
+            encode: Return the image as base64. Pass False with a path when
+                only the file is needed.
 
         Returns:
-            Base64-encoded screenshot data.
+            Base64-encoded screenshot data, or "" when encode is False.
         """
         self._ensure_started()
+        from .screenshot import take_screenshot
+
         self._recorder.record("screenshot", path=str(path) if path else None)
         return await take_screenshot(
             self.page,
             path=path,
             full_page=full_page,
             element_query=element,
+            quality=quality,
             retry=self._config.retry,
+            encode=encode,
         )
 
     # --- Forms ---
@@ -371,6 +544,7 @@ class BrowserAgent:
             submit: Click submit after filling (default: False).
         """
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("fill_form", fields=fields, submit=submit)
         await _fill_form(
             self.page,
@@ -390,7 +564,7 @@ class BrowserAgent:
     async def save_profile(self, name: str) -> None:
         """Save the current browser state as a named profile.
 
-        Captures cookies, localStorage, and sessionStorage.
+        Captures cookies and localStorage.
         Can be reloaded later with BrowserAgent(profile="name").
         """
         self._ensure_started()
@@ -407,6 +581,7 @@ class BrowserAgent:
         Returns True if profile was found and loaded.
         """
         self._ensure_started()
+        self._page_changing()
         return await load_context_profile(
             self._manager.context,
             self.page,
@@ -439,12 +614,12 @@ class BrowserAgent:
             name: Name of the recording to replay.
         """
         self._ensure_started()
-        actions = ActionRecorder.load(name, self._storage)
-        for recorded in actions:
-            method = getattr(self, recorded.action, None)
+        self._page_changing()
+        for recorded in ActionRecorder.stream(name, self._storage):
+            method, is_coro = self._dispatch.get(recorded.action, (None, False))
             if method is None:
                 continue
-            if asyncio.iscoroutinefunction(method):
+            if is_coro:
                 await method(**recorded.args)
             else:
                 method(**recorded.args)
@@ -454,10 +629,19 @@ class BrowserAgent:
     async def press(self, key: str) -> None:
         """Press a keyboard key (e.g., 'Enter', 'Tab', 'Escape')."""
         self._ensure_started()
+        self._page_changing()
         self._recorder.record("press", key=key)
         await self.page.keyboard.press(key)
 
     async def evaluate(self, expression: str) -> Any:
         """Evaluate JavaScript in the page context."""
         self._ensure_started()
+        self._page_changing()
         return await self.page.evaluate(expression)
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_params(name: str) -> frozenset[str]:
+    """Keyword arguments accepted by the BrowserAgent method for a batch action."""
+    params = inspect.signature(getattr(BrowserAgent, name)).parameters
+    return frozenset(params) - {"self"}
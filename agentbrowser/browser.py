@@ -2,19 +2,96 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import inspect
+import os
+import sys
+import traceback
+from typing import Any
 
 from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page
 
+from ._pool import shared_pool
 from .config import AgentConfig
 from .stealth import apply_stealth, random_user_agent
 
+_FAST_ENV = "AGENTBROWSER_FAST"
+_stack_patched = False
+
+
+class _NoStackInspect:
+    """Stand-in for the ``inspect`` module that skips call-stack capture."""
+
+    @staticmethod
+    def stack(context: int = 1) -> list[Any]:
+        return []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(inspect, name)
+
+
+class _NoStackTraceback:
+    """Stand-in for the ``traceback`` module that skips stack extraction."""
+
+    @staticmethod
+    def extract_stack(f: Any = None, limit: int | None = None) -> traceback.StackSummary:
+        return traceback.StackSummary()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(traceback, name)
+
+
+def _patch_playwright_stack() -> None:
+    """Stop Playwright from capturing the call stack on every API call.
+
+    Opt-in via ``AGENTBROWSER_FAST=1``. Playwright walks the whole Python
+    stack per call (``inspect.stack()`` in older releases, a frame walk plus
+    ``traceback.extract_stack`` in newer ones) only to fill tracing metadata
+    and error messages. The patched capture stops at the public API method,
+    so errors keep their "Page.goto:"-style prefix but lose user frames.
+    """
+    global _stack_patched
+    if _stack_patched or os.environ.get(_FAST_ENV, "").lower() not in ("1", "true", "yes"):
+        return
+    try:
+        import playwright
+        from playwright._impl import _connection, _impl_to_api_mapping
+    except ImportError:
+        return
+
+    pw_dir = os.path.dirname(playwright.__file__)
+    mapping_file = _impl_to_api_mapping.__file__
+
+    def capture_api_name() -> dict[str, Any]:
+        # Same frame offset as Playwright's own helper: skip it and its caller.
+        frame = sys._getframe(2)
+        api_name = ""
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(pw_dir):
+                if filename != mapping_file:
+                    owner = frame.f_locals.get("self")
+                    prefix = type(owner).__name__ + "." if owner is not None else ""
+                    api_name = prefix + frame.f_code.co_name
+            elif api_name:
+                break
+            frame = frame.f_back
+        return {"frames": [], "apiName": api_name, "title": None}
+
+    if hasattr(_connection, "_capture_stack_trace"):
+        _connection._capture_stack_trace = capture_api_name
+    if hasattr(_connection, "inspect"):
+        _connection.inspect = _NoStackInspect()  # type: ignore[attr-defined]
+    if hasattr(_connection, "traceback"):
+        _connection.traceback = _NoStackTraceback()  # type: ignore[attr-defined]
+    _stack_patched = True
+
 
 class BrowserManager:
     """Manages Playwright browser lifecycle: launch, contexts, pages."""
 
     def __init__(self, config: AgentConfig) -> None:
         self.config = config
+        _patch_playwright_stack()
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
@@ -34,25 +111,33 @@ class BrowserManager:
             raise BrowserNotStartedError()
         return self._context
 
-    async def start(self) -> Page:
-        """Launch browser and return the active page."""
-        self._playwright = await async_playwright().start()
+    async def start(self, storage_state: dict[str, Any] | None = None) -> Page:
+        """Launch browser and return the active page.
 
+        With ``share_browser`` set, the browser comes from the process-wide
+        pool and only a fresh context is created for this manager. A
+        ``storage_state`` seeds the new context's cookies and localStorage.
+        """
         bc = self.config.browser
-        launcher = getattr(self._playwright, bc.browser_type)
-
-        self._browser = await launcher.launch(
-            headless=bc.headless,
-            slow_mo=bc.slow_mo,
-        )
-
         ua = random_user_agent() if self.config.stealth.enabled else None
-        self._context = await self._browser.new_context(
-            viewport={"width": bc.viewport_width, "height": bc.viewport_height},
-            locale=bc.locale,
-            timezone_id=bc.timezone,
-            user_agent=ua,
-        )
+        context_options: dict[str, Any] = {
+            "viewport": {"width": bc.viewport_width, "height": bc.viewport_height},
+            "locale": bc.locale,
+            "timezone_id": bc.timezone,
+            "user_agent": ua,
+            "storage_state": storage_state,
+        }
+
+        if bc.share_browser:
+            self._context = await shared_pool.get_context(bc, **context_options)
+        else:
+            self._playwright = await async_playwright().start()
+            launcher = getattr(self._playwright, bc.browser_type)
+            self._browser = await launcher.launch(
+                headless=bc.headless,
+                slow_mo=bc.slow_mo,
+            )
+            self._context = await self._browser.new_context(**context_options)
 
         self._page = await self._context.new_page()
 
@@ -74,7 +159,7 @@ class BrowserManager:
         return page
 
     async def close(self) -> None:
-        """Clean up: close browser and playwright."""
+        """Clean up: close the context, plus browser and playwright if owned."""
         if self._context:
             try:
                 await self._context.close()
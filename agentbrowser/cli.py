@@ -3,43 +3,81 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from .agent import BrowserAgent
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Rich, BrowserAgent and Playwright are imported inside the commands that use
+# them, so `--help` and the profile commands start fast.
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """The shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _to_json(data: Any) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
-console = Console()
 
 # Shared state for CLI session (file-based for cross-command persistence)
 _SESSION_FILE = Path.home() / ".agentbrowser" / ".cli_session"
+# Set this to pass the session URL between commands without touching disk.
+_SESSION_ENV = "AGENTBROWSER_SESSION_URL"
 
 
-def _get_session_url() -> str | None:
-    """Get the current session URL (for chained commands)."""
-    if _SESSION_FILE.exists():
-        return _SESSION_FILE.read_text().strip() or None
-    return None
-
+# (mtime_ns, size, url) of the session file as last read
+_session_cache: tuple[int, int, str | None] | None = None
 
-def _save_session_url(url: str) -> None:
-    _SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _SESSION_FILE.write_text(url)
 
+def _get_session_url() -> str | None:
+    """Get the current session URL (for chained commands).
 
-def _run(coro):
-    """Run an async coroutine."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    AGENTBROWSER_SESSION_URL takes precedence over the session file. The file
+    is only re-read when its mtime or size has changed.
+    """
+    global _session_cache
+    env_url = os.environ.get(_SESSION_ENV)
+    if env_url:
+        return env_url
+    try:
+        st = os.stat(_SESSION_FILE)
+    except OSError:
+        _session_cache = None
+        return None
+    if _session_cache is not None and _session_cache[:2] == (st.st_mtime_ns, st.st_size):
+        return _session_cache[2]
+    url = _SESSION_FILE.read_text().strip() or None
+    _session_cache = (st.st_mtime_ns, st.st_size, url)
+    return url
 
 
-async def _agent_context(profile: str | None = None, headless: bool = True):
-    """Create a BrowserAgent for CLI use."""
-    return BrowserAgent(headless=headless, profile=profile)
+def _save_session_url(url: str) -> None:
+    global _session_cache
+    _SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # A tiny pointer file: a single unbuffered write, no text-mode wrapper.
+    fd = os.open(_SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, url.encode())
+    finally:
+        os.close(fd)
+    _session_cache = None
 
 
 @click.group()
@@ -60,11 +98,15 @@ def goto(url: str, profile: str | None, headed: bool) -> None:
     """Navigate to a URL and print page summary."""
 
     async def _run_goto():
+        from rich.panel import Panel
+
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=not headed, profile=profile) as agent:
             await agent.goto(url)
             _save_session_url(url)
             summary = await agent.page_summary()
-            console.print(Panel(summary, title="📄 Page Summary", border_style="blue"))
+            _console().print(Panel(summary, title="📄 Page Summary", border_style="blue"))
 
     asyncio.run(_run_goto())
 
@@ -77,14 +119,18 @@ def click_cmd(query: str, url: str | None, profile: str | None) -> None:
     """Click an element by text, label, or selector."""
 
     async def _run_click():
+        from rich.panel import Panel
+
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True, profile=profile) as agent:
             target = url or _get_session_url()
             if target:
                 await agent.goto(target)
             await agent.click(query)
-            console.print(f"✅ Clicked: [bold]{query}[/bold]")
+            _console().print(f"✅ Clicked: [bold]{query}[/bold]")
             summary = await agent.page_summary()
-            console.print(Panel(summary, title="📄 After Click", border_style="green"))
+            _console().print(Panel(summary, title="📄 After Click", border_style="green"))
 
     asyncio.run(_run_click())
 
@@ -103,12 +149,14 @@ def type_cmd(query: str, text: str, url: str | None, submit: bool, profile: str
     """Type text into an element (found by label/placeholder/selector)."""
 
     async def _run_type():
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True, profile=profile) as agent:
             target = url or _get_session_url()
             if target:
                 await agent.goto(target)
             await agent.type(query, text, submit=submit)
-            console.print(f"✅ Typed into [bold]{query}[/bold]: {text}")
+            _console().print(f"✅ Typed into [bold]{query}[/bold]: {text}")
 
     asyncio.run(_run_type())
 
@@ -122,12 +170,14 @@ def screenshot(output: str, url: str | None, full_page: bool, profile: str | Non
     """Take a screenshot and save to file."""
 
     async def _run_screenshot():
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True, profile=profile) as agent:
             target = url or _get_session_url()
             if target:
                 await agent.goto(target)
-            await agent.screenshot(output, full_page=full_page)
-            console.print(f"📸 Screenshot saved to [bold]{output}[/bold]")
+            await agent.screenshot(output, full_page=full_page, encode=False)
+            _console().print(f"📸 Screenshot saved to [bold]{output}[/bold]")
 
     asyncio.run(_run_screenshot())
 
@@ -140,6 +190,10 @@ def extract(url: str | None, fmt: str, profile: str | None) -> None:
     """Extract content from the page."""
 
     async def _run_extract():
+        from rich.table import Table
+
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True, profile=profile) as agent:
             target = url or _get_session_url()
             if target:
@@ -147,7 +201,7 @@ def extract(url: str | None, fmt: str, profile: str | None) -> None:
 
             if fmt == "text":
                 text = await agent.get_text()
-                console.print(text)
+                _console().print(text)
             elif fmt == "links":
                 links = await agent.get_links()
                 table = Table(title="Links")
@@ -155,15 +209,14 @@ def extract(url: str | None, fmt: str, profile: str | None) -> None:
                 table.add_column("URL", style="blue")
                 for link in links[:50]:
                     table.add_row(link.text[:60], link.href[:80])
-                console.print(table)
+                _console().print(table)
             elif fmt == "json":
-                meta = await agent.get_meta()
-                links = await agent.get_links()
+                meta, links = await agent.get_meta_and_links()
                 data = {
                     "meta": meta,
                     "links": [{"text": l.text, "href": l.href} for l in links],
                 }
-                click.echo(json.dumps(data, indent=2))
+                click.echo(_to_json(data))
 
     asyncio.run(_run_extract())
 
@@ -175,12 +228,16 @@ def summary(url: str | None, profile: str | None) -> None:
     """Get an LLM-friendly page summary."""
 
     async def _run_summary():
+        from rich.panel import Panel
+
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True, profile=profile) as agent:
             target = url or _get_session_url()
             if target:
                 await agent.goto(target)
             s = await agent.page_summary()
-            console.print(Panel(s, title="🤖 Page Summary", border_style="cyan"))
+            _console().print(Panel(s, title="🤖 Page Summary", border_style="cyan"))
 
     asyncio.run(_run_summary())
 
@@ -195,13 +252,15 @@ def profile() -> None:
 @profile.command("list")
 def profile_list() -> None:
     """List saved profiles."""
+    from rich.table import Table
+
     from .storage import Storage
     from .config import _default_data_dir
 
     storage = Storage(_default_data_dir() / "agentbrowser.db")
     profiles = storage.list_profiles()
     if not profiles:
-        console.print("[dim]No profiles saved yet.[/dim]")
+        _console().print("[dim]No profiles saved yet.[/dim]")
         return
     table = Table(title="Saved Profiles")
     table.add_column("Name", style="cyan")
@@ -209,7 +268,7 @@ def profile_list() -> None:
     table.add_column("Updated", style="yellow")
     for p in profiles:
         table.add_row(p["name"], p["created_at"][:19], p["updated_at"][:19])
-    console.print(table)
+    _console().print(table)
     storage.close()
 
 
@@ -220,11 +279,13 @@ def profile_create(name: str, url: str | None) -> None:
     """Create a new profile (optionally from a URL)."""
 
     async def _run():
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=True) as agent:
             if url:
                 await agent.goto(url)
             await agent.save_profile(name)
-            console.print(f"✅ Profile [bold]{name}[/bold] saved.")
+            _console().print(f"✅ Profile [bold]{name}[/bold] saved.")
 
     asyncio.run(_run())
 
@@ -238,9 +299,9 @@ def profile_delete(name: str) -> None:
 
     storage = Storage(_default_data_dir() / "agentbrowser.db")
     if storage.delete_profile(name):
-        console.print(f"🗑️  Profile [bold]{name}[/bold] deleted.")
+        _console().print(f"🗑️  Profile [bold]{name}[/bold] deleted.")
     else:
-        console.print(f"[red]Profile '{name}' not found.[/red]")
+        _console().print(f"[red]Profile '{name}' not found.[/red]")
     storage.close()
 
 
@@ -254,9 +315,11 @@ def replay(name: str, profile: str | None, headed: bool) -> None:
     """Replay a saved recording."""
 
     async def _run():
+        from .agent import BrowserAgent
+
         async with BrowserAgent(headless=not headed, profile=profile) as agent:
             await agent.replay(name)
-            console.print(f"✅ Replay of [bold]{name}[/bold] complete.")
+            _console().print(f"✅ Replay of [bold]{name}[/bold] complete.")
 
     asyncio.run(_run())
 
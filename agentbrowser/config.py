@@ -2,22 +2,107 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import os
+import types
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
-
-from pydantic import BaseModel, Field
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
 
 
+@functools.lru_cache(maxsize=1)
 def _default_data_dir() -> Path:
-    """Get the default data directory for agentbrowser."""
+    """Get the default data directory for agentbrowser (resolved once)."""
     xdg = os.environ.get("XDG_DATA_HOME")
     if xdg:
         return Path(xdg) / "agentbrowser"
     return Path.home() / ".agentbrowser"
 
 
-class BrowserConfig(BaseModel):
+_SUBDIRS = ("profiles", "recordings", "screenshots")
+
+# Data directories ensure_dirs has already created in this process.
+_ensured_dirs: set[Path] = set()
+
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+@functools.lru_cache(maxsize=None)
+def _field_types(cls: type) -> tuple[tuple[str, Any], ...]:
+    hints = get_type_hints(cls)
+    return tuple((f.name, hints[f.name]) for f in dataclasses.fields(cls))
+
+
+def _coerce(name: str, tp: Any, value: Any) -> Any:
+    """Check one field value against its annotation, converting where lossless.
+
+    Follows the pydantic models these classes replaced: numeric strings for
+    numbers, "yes"/"no"-style strings for bools, str for Path, dicts for
+    nested sections. Anything else raises ValueError.
+    """
+    origin = get_origin(tp)
+    if origin is Literal:
+        if value in get_args(tp):
+            return value
+        choices = ", ".join(repr(a) for a in get_args(tp))
+        raise ValueError(f"{name} must be one of {choices}, got {value!r}")
+    if origin is Union or origin is types.UnionType:  # X | None
+        if value is None:
+            return None
+        (inner,) = (a for a in get_args(tp) if a is not type(None))
+        return _coerce(name, inner, value)
+    if tp is bool:
+        if isinstance(value, bool):
+            return value
+        if value in (0, 1) and isinstance(value, (int, float)):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in _TRUE_STRINGS | _FALSE_STRINGS:
+            return value.strip().lower() in _TRUE_STRINGS
+    elif tp is int:
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            try:
+                return int(value.strip())
+            except ValueError:
+                pass
+    elif tp is float:
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value.strip())
+            except ValueError:
+                pass
+    elif tp is str:
+        if isinstance(value, str):
+            return value
+    elif tp is Path:
+        if isinstance(value, (str, os.PathLike)):
+            return Path(value)
+    elif dataclasses.is_dataclass(tp):
+        if isinstance(value, tp):
+            return value
+        if isinstance(value, dict):
+            return tp(**value)
+    raise ValueError(f"{name} must be {getattr(tp, '__name__', tp)}, got {value!r}")
+
+
+def _validate(config: Any) -> None:
+    """Coerce and validate every field of a config dataclass in place."""
+    for name, tp in _field_types(type(config)):
+        value = getattr(config, name)
+        coerced = _coerce(name, tp, value)
+        if coerced is not value:
+            object.__setattr__(config, name, coerced)
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserConfig:
     """Browser configuration."""
 
     headless: bool = True
@@ -29,9 +114,14 @@ class BrowserConfig(BaseModel):
     slow_mo: int = 0
     timeout_ms: int = 30000
     stealth: bool = True
+    share_browser: bool = False  # reuse one pooled browser across agents
+
+    def __post_init__(self) -> None:
+        _validate(self)
 
 
-class StealthConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StealthConfig:
     """Anti-detection configuration."""
 
     enabled: bool = True
@@ -42,28 +132,58 @@ class StealthConfig(BaseModel):
     realistic_typing: bool = True
     typing_delay_min_ms: int = 50
     typing_delay_max_ms: int = 150
+    typing_burst_chars: int = 8  # keystrokes per driver call in human_type
 
+    def __post_init__(self) -> None:
+        _validate(self)
 
-class RetryConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
     """Retry configuration for element finding and actions."""
 
     max_retries: int = 3
-    retry_delay_ms: int = 1000
+    retry_delay_ms: int = 1000  # base delay, doubled on each further attempt
+    max_retry_delay_ms: int = 30000
+    jitter: float = 0.5  # up to +50% random extra delay per attempt
     element_timeout_ms: int = 10000
+    # Try find_element's text strategies in one in-page script before
+    # falling back to one Playwright locator query per strategy.
+    batched_probe: bool = True
+
+    def __post_init__(self) -> None:
+        _validate(self)
 
 
-class AgentConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
     """Top-level agent configuration."""
 
-    browser: BrowserConfig = Field(default_factory=BrowserConfig)
-    stealth: StealthConfig = Field(default_factory=StealthConfig)
-    retry: RetryConfig = Field(default_factory=RetryConfig)
-    data_dir: Path = Field(default_factory=_default_data_dir)
+    browser: BrowserConfig = field(default_factory=BrowserConfig)
+    stealth: StealthConfig = field(default_factory=StealthConfig)
+    retry: RetryConfig = field(default_factory=RetryConfig)
+    data_dir: Path = field(default_factory=_default_data_dir)
     profile: str | None = None
 
+    def __post_init__(self) -> None:
+        _validate(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AgentConfig:
+        """Build a config from plain data, e.g. parsed JSON.
+
+        Nested sections are given as dicts; unknown keys raise TypeError.
+        """
+        return cls(**data)
+
     def ensure_dirs(self) -> None:
-        """Create data directories if they don't exist."""
+        """Create data directories if they don't exist.
+
+        Each data_dir is only created once per process.
+        """
+        if self.data_dir in _ensured_dirs:
+            return
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        (self.data_dir / "profiles").mkdir(exist_ok=True)
-        (self.data_dir / "recordings").mkdir(exist_ok=True)
-        (self.data_dir / "screenshots").mkdir(exist_ok=True)
+        for name in _SUBDIRS:
+            (self.data_dir / name).mkdir(exist_ok=True)
+        _ensured_dirs.add(self.data_dir)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -13,7 +15,7 @@ if TYPE_CHECKING:
     from playwright.async_api import ElementHandle, Locator, Page
 
 
-@dataclass
+@dataclass(slots=True)
 class FoundElement:
     """An element found on the page with metadata."""
 
@@ -27,9 +29,193 @@ class FoundElement:
         return f"<FoundElement tag={self.tag!r} text={self.text[:40]!r}>"
 
 
+_WS_RE = re.compile(r"\s+")
+# XPath/CSS prefixes, pseudo-elements, or spaced child/sibling combinators.
+_SEL_CLASSIFIER = re.compile(r"^(?://|xpath=|[#.\[])|::| [>~] ")
+
+# Everything FoundElement needs from a matched element, in one round-trip.
+_DESCRIBE_JS = """el => {
+    const tag = el.tagName.toLowerCase();
+    const isField = ['input', 'select', 'textarea'].includes(tag);
+    return {
+        tag,
+        text: isField ? '' : (el.innerText || '').trim().slice(0, 100),
+        type: el.type || null,
+        role: el.getAttribute('role') || null,
+    };
+}"""
+
+# Names of the first five matches, for _get_available_interactive.
+_NAMES_JS = """els => els.slice(0, 5).map(el => (el.innerText || '').trim().slice(0, 50))"""
+
+# Runs find_element's text strategies (role, label, placeholder, text,
+# title/aria-label) in one in-page pass, in plan order, and reports which step
+# matched first along with that element's tag and text, or null. The caller
+# then builds that step's Playwright locator, so the element is resolved by
+# role/label/text as before and not by its position in the DOM. Matching
+# follows ResolvedQuery.matcher: the page's text is whitespace-normalized, and
+# so is the query only when the matcher is the plain string; title/aria-label
+# compare the raw value, as attr_selector does. It doesn't look into shadow
+# roots, and accessible names are approximated, so a miss falls back to the
+# Playwright locator ladder.
+_PROBE_JS = """({ query, normalized, steps }) => {
+    const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const q = normalized ? norm(query) : query.toLowerCase();
+    if (!q.trim()) return null;
+    const has = (s) => norm(s).includes(q);
+    const raw = query.toLowerCase();
+    const equalsRaw = (s) => s !== null && s.toLowerCase() === raw;
+    const FORM_TAGS = ['input', 'select', 'textarea'];
+    const textOf = (el) => (el.innerText || el.textContent || '').trim().slice(0, 100);
+    const hit = (el, step, withText) => ({
+        step,
+        tag: el.tagName.toLowerCase(),
+        text: withText ? textOf(el) : '',
+    });
+    const isHidden = (el) => {
+        if (el.closest('[aria-hidden="true"], [hidden]')) return true;
+        if (el.tagName === 'OPTION') return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility === 'hidden' || el.getClientRects().length === 0;
+    };
+    const accessibleName = (el) => {
+        const aria = el.getAttribute('aria-label');
+        if (aria) return aria;
+        const ids = el.getAttribute('aria-labelledby');
+        if (ids) {
+            const t = ids.split(/\\s+/).map(id => document.getElementById(id)?.textContent || '').join(' ');
+            if (t.trim()) return t;
+        }
+        if (el.tagName === 'INPUT') return el.value || el.getAttribute('alt') || el.title || '';
+        const text = el.innerText || el.textContent || '';
+        if (text.trim()) return text;
+        const alts = Array.from(el.querySelectorAll('img[alt]'), img => img.alt).join(' ');
+        return alts || el.title || '';
+    };
+
+    // 2. ARIA role + name
+    const ROLES = [
+        ['button', 'button, input[type=button], input[type=submit], input[type=reset], '
+            + 'input[type=image], [role=button]'],
+        ['link', 'a[href], area[href], [role=link]'],
+        ['menuitem', '[role=menuitem]'],
+        ['tab', '[role=tab]'],
+        ['option', 'option, [role=option]'],
+    ];
+    for (const [role, selector] of ROLES) {
+        if (!steps.includes(`role:${role}`)) continue;
+        for (const el of document.querySelectorAll(selector)) {
+            const explicit = el.getAttribute('role');
+            if (explicit && explicit !== role) continue;
+            if (isHidden(el) || !has(accessibleName(el))) continue;
+            return hit(el, `role:${role}`, true);
+        }
+    }
+
+    // 3. Label text (for form inputs)
+    if (steps.includes('label')) {
+        for (const label of document.querySelectorAll('label')) {
+            if (label.control && has(label.innerText || label.textContent)) {
+                return hit(label.control, 'label', false);
+            }
+        }
+        for (const el of document.querySelectorAll('input[aria-label], select[aria-label], textarea[aria-label]')) {
+            if (has(el.getAttribute('aria-label'))) return hit(el, 'label', false);
+        }
+    }
+
+    // 4. Placeholder text
+    if (steps.includes('placeholder')) {
+        for (const el of document.querySelectorAll('[placeholder]')) {
+            if (has(el.getAttribute('placeholder'))) return hit(el, 'placeholder', false);
+        }
+    }
+
+    // 5. Text content (innermost element holding a matching text node)
+    if (steps.includes('text') && document.body) {
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const el = walker.currentNode.parentElement;
+            if (!el || ['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE'].includes(el.tagName)) continue;
+            if (has(walker.currentNode.data)) return hit(el, 'text', true);
+        }
+    }
+
+    // 6. Title or aria-label attribute (exact, case-insensitive)
+    if (steps.includes('attr')) {
+        for (const el of document.querySelectorAll('[title], [aria-label]')) {
+            if (equalsRaw(el.getAttribute('title')) || equalsRaw(el.getAttribute('aria-label'))) {
+                return hit(el, 'attr', !FORM_TAGS.includes(el.tagName.toLowerCase()));
+            }
+        }
+    }
+    return null;
+}"""
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedQuery:
+    """A user query, classified once for find_element."""
+
+    value: str
+    plan: tuple[str, ...]  # find_element steps to run, see _search_plan
+    pattern: re.Pattern[str]  # case-insensitive literal match of value
+    # What the locator ladder passes to Playwright: the plain string when
+    # Playwright's own matching (case-insensitive substring after whitespace
+    # normalization) means the same as pattern, which skips regex matching in
+    # the selector engine.
+    matcher: str | re.Pattern[str]
+    attr_selector: str  # exact, case-insensitive title/aria-label match
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_query(query: str) -> ResolvedQuery:
+    """Classify a query and compile its match pattern (cached per query string)."""
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    return ResolvedQuery(
+        value=query,
+        plan=_search_plan(query),
+        pattern=pattern,
+        matcher=query if query and _WS_RE.sub(" ", query.strip()) == query else pattern,
+        attr_selector=f"[title={_css_string(query)} i], [aria-label={_css_string(query)} i]",
+    )
+
+
+_ROLES = ("button", "link", "menuitem", "tab", "option")
+
+# Queries naming an action rather than a field; label/placeholder can't match.
+_ACTION_WORDS = frozenset({
+    "submit", "login", "log in", "logout", "log out", "sign in", "sign up",
+    "sign out", "register", "continue", "next", "back", "cancel", "close",
+    "ok", "save", "delete", "confirm", "buy now", "add to cart", "checkout",
+})
+
+
+def _search_plan(query: str) -> tuple[str, ...]:
+    """The ordered find_element steps worth running for a query.
+
+    Steps are "css", "probe" (the batched in-page search), "role:<name>",
+    "label", "placeholder", "text" and "attr" (title/aria-label). Selector-
+    like queries get the CSS lookup plus the probe only; action words skip
+    the label and placeholder lookups.
+    """
+    if _looks_like_selector(query):
+        return ("css", "probe")
+    roles = tuple(f"role:{role}" for role in _ROLES)
+    if _normalize(query) in _ACTION_WORDS:
+        return ("probe", *roles, "text", "attr")
+    return ("probe", *roles, "label", "placeholder", "text", "attr")
+
+
+def _css_string(value: str) -> str:
+    """Quote a value as a CSS string literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\a ")
+    return f'"{escaped}"'
+
+
 def _normalize(text: str) -> str:
     """Normalize text for fuzzy matching."""
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return _WS_RE.sub(" ", text.strip().lower())
 
 
 def _fuzzy_match(query: str, text: str) -> bool:
@@ -43,6 +229,8 @@ async def find_element(
     page: Page,
     query: str,
     config: RetryConfig | None = None,
+    *,
+    verbose: bool = True,
 ) -> FoundElement:
     """Find a single element by text, label, placeholder, selector, or role.
 
@@ -54,102 +242,124 @@ async def find_element(
     5. Placeholder text
     6. Any visible text content (fuzzy)
 
+    Steps that can't apply to the query are skipped (see _search_plan).
+
     Raises ElementNotFoundError with helpful alternatives if not found.
+    With verbose=False the alternatives are skipped, which saves enumerating
+    the page's interactive elements when the caller is going to retry.
     """
+    q = parse_query(query)
+
     # 1. Try as CSS selector first (if it has selector-like chars)
-    if _looks_like_selector(query):
+    if "css" in q.plan:
         loc = page.locator(query)
         if await loc.count() > 0:
-            first = loc.first
-            tag = await first.evaluate("el => el.tagName.toLowerCase()") or "unknown"
-            text = (await first.inner_text()).strip()[:100] if tag not in ("input", "select", "textarea") else ""
-            return FoundElement(locator=first, tag=tag, text=text)
-
-    # 2. Try get_by_role for common interactive elements
-    for role in ("button", "link", "menuitem", "tab", "option"):
-        loc = page.get_by_role(role, name=re.compile(re.escape(query), re.IGNORECASE))
-        if await loc.count() > 0:
-            first = loc.first
-            tag = await first.evaluate("el => el.tagName.toLowerCase()") or role
-            text = (await first.inner_text()).strip()[:100]
-            return FoundElement(locator=first, tag=tag, text=text, role=role)
-
-    # 3. Try by label (for form inputs)
-    loc = page.get_by_label(re.compile(re.escape(query), re.IGNORECASE))
-    if await loc.count() > 0:
-        first = loc.first
-        tag = await first.evaluate("el => el.tagName.toLowerCase()") or "input"
-        return FoundElement(locator=first, tag=tag, text="", label=query)
-
-    # 4. Try by placeholder
-    loc = page.get_by_placeholder(re.compile(re.escape(query), re.IGNORECASE))
-    if await loc.count() > 0:
-        first = loc.first
-        tag = await first.evaluate("el => el.tagName.toLowerCase()") or "input"
-        return FoundElement(locator=first, tag=tag, text="", label=query)
-
-    # 5. Try by text content (any element)
-    loc = page.get_by_text(re.compile(re.escape(query), re.IGNORECASE))
-    if await loc.count() > 0:
-        first = loc.first
-        tag = await first.evaluate("el => el.tagName.toLowerCase()") or "unknown"
-        text = (await first.inner_text()).strip()[:100]
-        return FoundElement(locator=first, tag=tag, text=text)
-
-    # 6. Try by title or aria-label attribute
-    loc = page.locator(f'[title="{query}" i], [aria-label="{query}" i]')
-    if await loc.count() > 0:
-        first = loc.first
-        tag = await first.evaluate("el => el.tagName.toLowerCase()") or "unknown"
-        text_val = await first.inner_text() if tag not in ("input", "select", "textarea") else ""
-        return FoundElement(locator=first, tag=tag, text=text_val.strip()[:100])
+            return await _describe(loc.first, "unknown")
+
+    # 2-6 in a single round-trip; the locator ladder below is the fallback
+    if "probe" in q.plan and (config is None or config.batched_probe):
+        hit = await page.evaluate(
+            _PROBE_JS,
+            {"query": query, "normalized": isinstance(q.matcher, str), "steps": list(q.plan)},
+        )
+        # The probe only approximates Playwright's matching; if that step's
+        # locator disagrees, the ladder decides.
+        loc = _step_locator(page, q, hit["step"]).first if hit else None
+        if loc is not None and await loc.count() > 0:
+            step = hit["step"]
+            return FoundElement(
+                locator=loc,
+                tag=hit["tag"],
+                text=hit["text"],
+                role=step[5:] if step.startswith("role:") else None,
+                label=query if step in ("label", "placeholder") else None,
+            )
+
+    # 2. Try get_by_role for common interactive elements. count() has no
+    # side effects, so every role is probed at once and priority applied after.
+    roles = [step for step in q.plan if step.startswith("role:")]
+    locs = [_step_locator(page, q, step) for step in roles]
+    counts = await asyncio.gather(*(loc.count() for loc in locs))
+    for step, loc, count in zip(roles, locs, counts):
+        if count > 0:
+            return await _describe(loc.first, step[5:], role=step[5:])
+
+    # 3-6 are probed together the same way, then taken in plan order:
+    # label and placeholder (form inputs), any text content, title/aria-label
+    steps = [step for step in q.plan if step in ("label", "placeholder", "text", "attr")]
+    locs = [_step_locator(page, q, step) for step in steps]
+    counts = await asyncio.gather(*(loc.count() for loc in locs))
+    for step, loc, count in zip(steps, locs, counts):
+        if count == 0:
+            continue
+        if step in ("label", "placeholder"):
+            return await _describe(loc.first, "input", label=query, with_text=False)
+        return await _describe(loc.first, "unknown")
 
     # Not found — collect available elements for helpful error
+    if not verbose:
+        raise ElementNotFoundError(query)
     available = await _get_available_interactive(page)
     raise ElementNotFoundError(query, available)
 
 
+def _step_locator(page: Page, q: ResolvedQuery, step: str) -> Locator:
+    """The Playwright locator for one text step of a query's plan."""
+    if step.startswith("role:"):
+        return page.get_by_role(step[5:], name=q.matcher)  # type: ignore[arg-type]
+    if step == "label":
+        return page.get_by_label(q.matcher)
+    if step == "placeholder":
+        return page.get_by_placeholder(q.matcher)
+    if step == "text":
+        return page.get_by_text(q.matcher)
+    return page.locator(q.attr_selector)
+
+
+async def _describe(
+    locator: Locator,
+    default_tag: str,
+    *,
+    role: str | None = None,
+    label: str | None = None,
+    with_text: bool = True,
+) -> FoundElement:
+    """Build a FoundElement with a single evaluate for tag and text."""
+    info = await locator.evaluate(_DESCRIBE_JS)
+    return FoundElement(
+        locator=locator,
+        tag=info["tag"] or default_tag,
+        text=info["text"] if with_text else "",
+        role=role,
+        label=label,
+    )
+
+
 async def find_all_by_role(page: Page, role: str) -> list[FoundElement]:
     """Find all elements with a given ARIA role."""
     loc = page.get_by_role(role)
-    count = await loc.count()
-    results: list[FoundElement] = []
-    for i in range(min(count, 50)):
-        el = loc.nth(i)
-        tag = await el.evaluate("el => el.tagName.toLowerCase()") or role
-        try:
-            text = (await el.inner_text()).strip()[:100]
-        except Exception:
-            text = ""
-        results.append(FoundElement(locator=el, tag=tag, text=text, role=role))
-    return results
+    infos = await loc.evaluate_all(f"els => els.slice(0, 50).map({_DESCRIBE_JS})")
+    return [
+        FoundElement(locator=loc.nth(i), tag=info["tag"] or role, text=info["text"], role=role)
+        for i, info in enumerate(infos)
+    ]
 
 
 async def _get_available_interactive(page: Page, limit: int = 15) -> list[str]:
     """Get text of interactive elements for error messages."""
+    roles = ("button", "link", "textbox", "menuitem")
+    batches = await asyncio.gather(
+        *(page.get_by_role(role).evaluate_all(_NAMES_JS) for role in roles),
+        return_exceptions=True,
+    )
     items: list[str] = []
-    for role in ("button", "link", "textbox", "menuitem"):
-        loc = page.get_by_role(role)
-        count = await loc.count()
-        for i in range(min(count, 5)):
-            el = loc.nth(i)
-            try:
-                name = (await el.inner_text()).strip()[:50]
-                if name:
-                    items.append(f"[{role}] {name}")
-            except Exception:
-                pass
-        if len(items) >= limit:
-            break
+    for role, names in zip(roles, batches):
+        if isinstance(names, BaseException):
+            continue
+        items.extend(f"[{role}] {name}" for name in names if name)
     return items[:limit]
 
 
 def _looks_like_selector(query: str) -> bool:
     """Heuristic: does this look like a CSS/XPath selector rather than text?"""
-    if query.startswith(("//", "xpath=")):
-        return True
-    if re.match(r"^[#.\[]", query):
-        return True
-    if "::" in query or " > " in query or " ~ " in query:
-        return True
-    return False
+    return _SEL_CLASSIFIER.search(query) is not None
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     """A link extracted from the page."""
 
@@ -21,7 +21,7 @@ class Link:
         return f"Link({self.text!r}, {self.href!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TableData:
     """A table extracted from the page."""
 
@@ -29,99 +29,171 @@ class TableData:
     rows: list[list[str]]
 
 
-async def get_visible_text(page: Page) -> str:
+@dataclass(slots=True)
+class PageContent:
+    """Everything extracted from a page in one pass."""
+
+    meta: dict[str, str]
+    links: list[Link] = field(default_factory=list)
+    tables: list[TableData] = field(default_factory=list)
+    text: str = ""
+
+
+# Stops walking once max_chars is reached (null means no limit), and trims
+# each text node only once.
+_VISIBLE_TEXT_JS = """(maxChars) => {
+    const max = maxChars ?? Infinity;
+    const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_TEXT,
+        {
+            acceptNode: (node) => {
+                if (!/\\S/.test(node.data)) return NodeFilter.FILTER_REJECT;
+                const el = node.parentElement;
+                if (!el) return NodeFilter.FILTER_REJECT;
+                const style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0')
+                    return NodeFilter.FILTER_REJECT;
+                const tag = el.tagName.toLowerCase();
+                if (['script', 'style', 'noscript', 'template'].includes(tag))
+                    return NodeFilter.FILTER_REJECT;
+                return NodeFilter.FILTER_ACCEPT;
+            }
+        }
+    );
+    const texts = [];
+    let total = 0;
+    while (total < max && walker.nextNode()) {
+        const text = walker.currentNode.data.trim();
+        texts.push(text);
+        total += text.length + 1;
+    }
+    return texts.join('\\n').slice(0, max);
+}"""
+
+# Column arrays rather than one object per link: a single flat payload, with
+# is_external worked out in the page.
+_LINKS_JS = """() => {
+    const origin = window.location.origin;
+    const texts = [], hrefs = [], external = [];
+    document.querySelectorAll('a[href]').forEach(a => {
+        const text = a.innerText?.trim() || a.getAttribute('aria-label') || '';
+        const href = a.href || '';
+        if (text && href) {
+            texts.push(text.slice(0, 200));
+            hrefs.push(href);
+            external.push(!href.startsWith(origin));
+        }
+    });
+    return { texts, hrefs, external };
+}"""
+
+_TABLES_JS = """() => {
+    const tables = [];
+    document.querySelectorAll('table').forEach(table => {
+        const headers = [];
+        table.querySelectorAll('thead th, thead td').forEach(th => {
+            headers.push(th.innerText?.trim() || '');
+        });
+        const rows = [];
+        table.querySelectorAll('tbody tr').forEach(tr => {
+            const cells = [];
+            tr.querySelectorAll('td, th').forEach(td => {
+                cells.push(td.innerText?.trim() || '');
+            });
+            if (cells.length) rows.push(cells);
+        });
+        tables.push({ headers, rows });
+    });
+    return tables;
+}"""
+
+_META_JS = """() => {
+    const meta = {};
+    meta.title = document.title || '';
+    meta.url = window.location.href;
+    meta.origin = window.location.origin;
+    const keys = new Map([
+        ['description', 'description'],
+        ['og:title', 'og_title'],
+        ['og:description', 'og_description'],
+    ]);
+    document.querySelectorAll('meta[name], meta[property]').forEach(el => {
+        const key = keys.get(el.getAttribute('name') || el.getAttribute('property'));
+        // First tag wins, as with querySelector
+        if (key && !(key in meta)) meta[key] = el.getAttribute('content') || '';
+    });
+    return meta;
+}"""
+
+# All extractors in a single evaluate; opts selects which optional parts run.
+_EXTRACT_ALL_JS = (
+    "(opts) => ({"
+    f" meta: ({_META_JS})(),"
+    f" links: opts.links ? ({_LINKS_JS})() : null,"
+    f" tables: opts.tables ? ({_TABLES_JS})() : [],"
+    f" text: opts.text ? ({_VISIBLE_TEXT_JS})(opts.maxChars) : '',"
+    " })"
+)
+
+
+def _to_links(raw: dict[str, list[Any]]) -> list[Link]:
+    return [
+        Link(text, href, is_external)
+        for text, href, is_external in zip(raw["texts"], raw["hrefs"], raw["external"])
+    ]
+
+
+async def get_visible_text(page: Page, max_chars: int | None = 200_000) -> str:
     """Get all visible text content from the page.
 
-    Excludes hidden elements, scripts, and styles.
+    Excludes hidden elements, scripts, and styles. The result is cut off at
+    max_chars (pass None for no limit).
     """
-    return await page.evaluate("""() => {
-        const walker = document.createTreeWalker(
-            document.body,
-            NodeFilter.SHOW_TEXT,
-            {
-                acceptNode: (node) => {
-                    const el = node.parentElement;
-                    if (!el) return NodeFilter.FILTER_REJECT;
-                    const style = window.getComputedStyle(el);
-                    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0')
-                        return NodeFilter.FILTER_REJECT;
-                    const tag = el.tagName.toLowerCase();
-                    if (['script', 'style', 'noscript', 'template'].includes(tag))
-                        return NodeFilter.FILTER_REJECT;
-                    const text = node.textContent.trim();
-                    if (!text) return NodeFilter.FILTER_REJECT;
-                    return NodeFilter.FILTER_ACCEPT;
-                }
-            }
-        );
-        const texts = [];
-        while (walker.nextNode()) {
-            texts.push(walker.currentNode.textContent.trim());
-        }
-        return texts.join('\\n');
-    }""")
+    return await page.evaluate(_VISIBLE_TEXT_JS, max_chars)
 
 
 async def get_links(page: Page) -> list[Link]:
     """Get all links from the page with their text and href."""
-    raw: list[dict[str, str]] = await page.evaluate("""() => {
-        const links = [];
-        document.querySelectorAll('a[href]').forEach(a => {
-            const text = a.innerText?.trim() || a.getAttribute('aria-label') || '';
-            const href = a.href || '';
-            if (text && href) {
-                links.push({ text: text.slice(0, 200), href });
-            }
-        });
-        return links;
-    }""")
-    current_origin = await page.evaluate("window.location.origin")
-    return [
-        Link(
-            text=r["text"],
-            href=r["href"],
-            is_external=not r["href"].startswith(current_origin),
-        )
-        for r in raw
-    ]
+    return _to_links(await page.evaluate(_LINKS_JS))
 
 
 async def get_tables(page: Page) -> list[TableData]:
     """Extract all tables from the page."""
-    raw: list[dict[str, Any]] = await page.evaluate("""() => {
-        const tables = [];
-        document.querySelectorAll('table').forEach(table => {
-            const headers = [];
-            table.querySelectorAll('thead th, thead td').forEach(th => {
-                headers.push(th.innerText?.trim() || '');
-            });
-            const rows = [];
-            table.querySelectorAll('tbody tr').forEach(tr => {
-                const cells = [];
-                tr.querySelectorAll('td, th').forEach(td => {
-                    cells.push(td.innerText?.trim() || '');
-                });
-                if (cells.length) rows.push(cells);
-            });
-            tables.push({ headers, rows });
-        });
-        return tables;
-    }""")
+    raw: list[dict[str, Any]] = await page.evaluate(_TABLES_JS)
     return [TableData(headers=t["headers"], rows=t["rows"]) for t in raw]
 
 
 async def get_meta(page: Page) -> dict[str, str]:
     """Get page metadata (title, description, url, etc.)."""
-    return await page.evaluate("""() => {
-        const meta = {};
-        meta.title = document.title || '';
-        meta.url = window.location.href;
-        meta.origin = window.location.origin;
-        const desc = document.querySelector('meta[name="description"]');
-        if (desc) meta.description = desc.getAttribute('content') || '';
-        const ogTitle = document.querySelector('meta[property="og:title"]');
-        if (ogTitle) meta.og_title = ogTitle.getAttribute('content') || '';
-        const ogDesc = document.querySelector('meta[property="og:description"]');
-        if (ogDesc) meta.og_description = ogDesc.getAttribute('content') || '';
-        return meta;
-    }""")
+    return await page.evaluate(_META_JS)
+
+
+async def get_all(
+    page: Page,
+    *,
+    links: bool = True,
+    tables: bool = True,
+    text: bool = True,
+    max_chars: int | None = 200_000,
+) -> PageContent:
+    """Get metadata, links, tables, and visible text in a single round-trip.
+
+    Args:
+        page: The Playwright page.
+        links: Include links.
+        tables: Include tables.
+        text: Include visible text.
+        max_chars: Cut the visible text off at this length (None for no limit).
+
+    Returns:
+        A PageContent; parts that were not requested are left empty.
+    """
+    opts = {"links": links, "tables": tables, "text": text, "maxChars": max_chars}
+    raw: dict[str, Any] = await page.evaluate(_EXTRACT_ALL_JS, opts)
+    return PageContent(
+        meta=raw["meta"],
+        links=_to_links(raw["links"]) if links else [],
+        tables=[TableData(headers=t["headers"], rows=t["rows"]) for t in raw["tables"]],
+        text=raw["text"],
+    )
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from .elements import find_element
+from .elements import FoundElement, find_element
 from .config import RetryConfig, StealthConfig
+from .exceptions import ElementNotFoundError
 from .stealth import random_delay
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
 
-@dataclass
+@dataclass(slots=True)
 class FormField:
     """A detected form field."""
 
@@ -26,7 +28,7 @@ class FormField:
     options: list[str] = field(default_factory=list)  # for select/radio
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedForm:
     """A form detected on the page."""
 
@@ -36,6 +38,16 @@ class DetectedForm:
     submit_text: str = "Submit"
 
 
+# The first form's submit button text, as detect_forms would report it, or
+# null when the page has no form.
+_SUBMIT_TEXT_JS = """() => {
+    const form = document.querySelector('form');
+    if (!form) return null;
+    const btn = form.querySelector('button[type="submit"], input[type="submit"]');
+    return (btn && (btn.innerText?.trim() || btn.value)) || 'Submit';
+}"""
+
+
 async def detect_forms(page: Page) -> list[DetectedForm]:
     """Detect all forms on the page with their fields."""
     raw = await page.evaluate("""() => {
@@ -104,6 +116,41 @@ async def detect_forms(page: Page) -> list[DetectedForm]:
     ]
 
 
+async def _input_type(el: FoundElement) -> str | None:
+    """The type attribute of an input/textarea, or None for other elements."""
+    if el.tag not in ("input", "textarea"):
+        return None
+    return await el.locator.get_attribute("type") or "text"
+
+
+async def _locate(
+    page: Page, label: str, retry: RetryConfig, *, verbose: bool = True
+) -> tuple[FoundElement, str | None]:
+    """Find a form field and read its input type."""
+    el = await find_element(page, label, retry, verbose=verbose)
+    return el, await _input_type(el)
+
+
+async def _fill_one(
+    el: FoundElement, input_type: str | None, value: str, stealth: StealthConfig
+) -> None:
+    """Write a single value into a located form field."""
+    if el.tag == "select":
+        await el.locator.select_option(label=value)
+    elif input_type == "checkbox":
+        checked = await el.locator.is_checked()
+        should_check = value.lower() in ("true", "yes", "1", "on")
+        if checked != should_check:
+            await el.locator.click()
+    elif input_type == "radio":
+        await el.locator.click()
+    elif input_type is not None and stealth.realistic_typing:
+        await el.locator.clear()
+        await el.locator.press_sequentially(value, delay=stealth.typing_delay_min_ms)
+    else:
+        await el.locator.fill(value)  # replaces the value; no clear needed
+
+
 async def fill_form(
     page: Page,
     field_values: dict[str, str],
@@ -121,38 +168,36 @@ async def fill_form(
         retry: Retry configuration.
         stealth: Stealth configuration.
     """
-    for label, value in field_values.items():
-        el = await find_element(page, label, retry)
-        tag = el.tag
-
-        if tag == "select":
-            await el.locator.select_option(label=value)
-        elif tag in ("input", "textarea"):
-            input_type = await el.locator.get_attribute("type") or "text"
-            if input_type == "checkbox":
-                checked = await el.locator.is_checked()
-                should_check = value.lower() in ("true", "yes", "1", "on")
-                if checked != should_check:
-                    await el.locator.click()
-            elif input_type == "radio":
-                await el.locator.click()
-            else:
-                await el.locator.clear()
-                if stealth.realistic_typing:
-                    await el.locator.press_sequentially(value, delay=stealth.typing_delay_min_ms)
-                else:
-                    await el.locator.fill(value)
-        else:
-            await el.locator.fill(value)
-
-        await random_delay(stealth)
+    # Locate every field and read its input type up front in parallel. A
+    # field that only appears once an earlier one is filled (an "Other" box
+    # behind a select, country -> state) misses here, and one whose locator
+    # stopped matching after an earlier write is stale; both are looked up
+    # again right before their write. The writes stay serial: fill() and
+    # typing go to the focused element, so two concurrent writes could land
+    # in the same field.
+    located = await asyncio.gather(
+        *(_locate(page, label, retry, verbose=False) for label in field_values),
+        return_exceptions=True,
+    )
+    for i, (label, value) in enumerate(field_values.items()):
+        result = located[i]
+        if isinstance(result, BaseException):
+            if not isinstance(result, ElementNotFoundError):
+                raise result
+            result = await _locate(page, label, retry)
+        elif i > 0 and await result[0].locator.count() == 0:
+            result = await _locate(page, label, retry)
+        el, input_type = result
+        await _fill_one(el, input_type, value, stealth)
+        if stealth.enabled:
+            await random_delay(stealth)
 
     if submit:
         # Try to find and click a submit button
-        forms = await detect_forms(page)
-        if forms:
+        submit_text = await page.evaluate(_SUBMIT_TEXT_JS)
+        if submit_text:
             try:
-                el = await find_element(page, forms[0].submit_text, retry)
+                el = await find_element(page, submit_text, retry)
                 await el.locator.click()
             except Exception:
                 await page.keyboard.press("Enter")
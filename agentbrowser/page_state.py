@@ -2,16 +2,145 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any
 
-from .extraction import get_links, get_meta
+from .extraction import get_all
 from .forms import detect_forms
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
-
-async def page_summary(page: Page, *, max_items: int = 20) -> str:
+    from .extraction import Link
+    from .forms import DetectedForm
+
+# First 500 characters of the main content, already cut to the 8 lines the
+# summary shows, so only that much crosses the driver boundary.
+_CONTENT_PREVIEW_JS = """() => {
+    const main = document.querySelector('main, [role="main"], article, .content, #content');
+    const target = main || document.body;
+    const text = target.innerText?.slice(0, 500).trim() || '';
+    return text.split('\\n', 8).join('\\n');
+}"""
+
+
+# Visible interactive elements for page_summary, grouped by role in display
+# order. As with get_by_role, open shadow roots are searched, elements hidden
+# from the accessibility tree (aria-hidden, display:none, visibility:hidden)
+# are left out before the first maxItems matches per role are taken, and an
+# explicit role overrides the implicit one; those matches are then checked
+# for a non-empty box. Inputs are named by placeholder/aria-label, other
+# elements by their text (and skipped when it is empty).
+_ELEMENTS_JS = """(maxItems) => {
+    const TEXT_TYPES = ['', 'text', 'email', 'tel', 'url', 'password'];
+    const ROLES = [
+        ['button', 'button, input[type=button], input[type=submit], input[type=reset], '
+            + 'input[type=image], [role=button]'],
+        ['link', 'a[href], area[href], [role=link]'],
+        ['textbox', 'input, textarea, [role=textbox]'],
+        ['combobox', 'select, input[list], [role=combobox]'],
+        ['listbox', 'select, [role=listbox]'],
+        ['checkbox', 'input[type=checkbox], [role=checkbox]'],
+        ['radio', 'input[type=radio], [role=radio]'],
+        ['tab', '[role=tab]'],
+        ['menuitem', '[role=menuitem]'],
+    ];
+    const isTextbox = (el) => el.tagName !== 'INPUT'
+        || (TEXT_TYPES.includes(el.getAttribute('type')?.toLowerCase() ?? '') && !el.hasAttribute('list'));
+    // <select multiple> and <select size=N> (N > 1) are listboxes, others comboboxes
+    const isListbox = (el) => el.multiple || el.size > 1;
+    const implicitMatch = (el, role) => {
+        if (role === 'textbox') return isTextbox(el);
+        if (el.tagName === 'SELECT') return (role === 'listbox') === isListbox(el);
+        return true;
+    };
+    const isHidden = (el) => el.closest('[aria-hidden="true"], [hidden]')
+        || el.getClientRects().length === 0
+        || window.getComputedStyle(el).visibility === 'hidden';
+    const hasBox = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    // Every element in tree order, with open shadow trees right after their host
+    const all = [];
+    const collect = (root) => {
+        for (const el of root.querySelectorAll('*')) {
+            all.push(el);
+            if (el.shadowRoot) collect(el.shadowRoot);
+        }
+    };
+    collect(document);
+    const items = [];
+    for (const [role, selector] of ROLES) {
+        const matches = [];
+        for (const el of all) {
+            if (matches.length >= maxItems) break;
+            if (!el.matches(selector)) continue;
+            const explicit = el.getAttribute('role');
+            if (explicit ? explicit !== role : !implicitMatch(el, role)) continue;
+            if (isHidden(el)) continue;
+            matches.push(el);
+        }
+        for (const el of matches) {
+            if (!hasBox(el)) continue;
+            const item = { role, name: '', value: '', checked: false, selected: false };
+            if (role === 'textbox' || role === 'combobox' || role === 'listbox') {
+                item.name = el.getAttribute('placeholder') || el.getAttribute('aria-label') || '';
+                if (role === 'textbox') item.value = el.value ?? '';
+            } else {
+                item.name = (el.innerText || '').trim().slice(0, 80);
+                if (!item.name) continue;
+            }
+            if (role === 'checkbox' || role === 'radio') {
+                item.checked = el.checked ?? el.getAttribute('aria-checked') === 'true';
+            } else if (role === 'tab') {
+                item.selected = el.getAttribute('aria-selected') === 'true';
+            }
+            items.push(item);
+        }
+    }
+    return items;
+}"""
+
+
+# Installs (once per document, on first use) a counter bumped on every DOM
+# mutation and on input/change events, since field values and checked state
+# are properties and don't show up as mutations. The counter lives under a
+# Symbol key as a non-enumerable property, so it doesn't show up among the
+# page's globals. Returns [document id, revision]; the id is the document's
+# timeOrigin, so a reload or navigation never reuses a key.
+_DOM_REV_JS = """() => {
+    const key = Symbol.for('agentbrowser.domRev');
+    let rev = window[key];
+    if (!rev) {
+        rev = { n: 0 };
+        Object.defineProperty(window, key, { value: rev });
+        const bump = () => { rev.n++; };
+        new MutationObserver(bump).observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true,
+        });
+        document.addEventListener('input', bump, true);
+        document.addEventListener('change', bump, true);
+    }
+    return [performance.timeOrigin, rev.n];
+}"""
+
+# Last summary per page, keyed by (url, document id, revision, max_items).
+# The revision misses changes that are neither mutations nor input events
+# (:hover menus, viewport changes, properties set by scripts), so BrowserAgent
+# drops the entry on every action, and fresh=True bypasses it.
+_summary_cache: weakref.WeakKeyDictionary[Page, tuple[tuple[Any, ...], str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_summary(page: Page) -> None:
+    """Forget the cached page_summary for a page."""
+    _summary_cache.pop(page, None)
+
+
+async def page_summary(page: Page, *, max_items: int = 20, fresh: bool = False) -> str:
     """Generate an LLM-friendly summary of the current page state.
 
     Returns a structured text summary including:
@@ -24,96 +153,97 @@ async def page_summary(page: Page, *, max_items: int = 20) -> str:
     Args:
         page: The Playwright page.
         max_items: Maximum number of items per category.
+        fresh: Rebuild the summary even if the DOM looks unchanged since the
+            last call.
 
     Returns:
         A formatted string suitable for LLM consumption.
     """
-    meta = await get_meta(page)
-    lines: list[str] = []
-
-    # Header
-    lines.append(f"URL: {meta.get('url', 'unknown')}")
-    lines.append(f"Title: {meta.get('title', 'untitled')}")
+    # Unchanged DOM since the last call: reuse that summary
+    key = (page.url, *await page.evaluate(_DOM_REV_JS), max_items)
+    cached = _summary_cache.get(page)
+    if not fresh and cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Every read is independent, so they all go out at once; meta and links
+    # come back from one combined extraction call.
+    content, elements, forms, text_content = await asyncio.gather(
+        get_all(page, tables=False, text=False),
+        page.evaluate(_ELEMENTS_JS, max_items),
+        detect_forms(page),
+        page.evaluate(_CONTENT_PREVIEW_JS),
+    )
+    lines = [
+        *_header(content.meta),
+        *_elements_section(elements),
+        *_forms_section(forms),
+        *_links_section(content.links, max_items),
+        *_content_section(text_content),
+    ]
+    summary = "\n".join(lines)
+    _summary_cache[page] = (key, summary)
+    return summary
+
+
+def _header(meta: dict[str, str]) -> list[str]:
+    return [
+        f"URL: {meta.get('url', 'unknown')}",
+        f"Title: {meta.get('title', 'untitled')}",
+        "",
+    ]
+
+
+def _elements_section(elements: list[dict[str, Any]]) -> list[str]:
+    """Interactive elements by role."""
+    lines = ["VISIBLE ELEMENTS:"]
+    for item in elements:
+        role, name = item["role"], item["name"]
+        entry = f'- [{role}] "{name}"'
+        if item["value"]:
+            entry += f' (value: "{item["value"][:50]}")'
+        if role in ("checkbox", "radio"):
+            entry += f" ({'checked' if item['checked'] else 'unchecked'})"
+        elif role == "tab" and item["selected"]:
+            entry += " (active)"
+        lines.append(entry)
     lines.append("")
-
-    # Interactive elements by role
-    lines.append("VISIBLE ELEMENTS:")
-    for role in ("button", "link", "textbox", "combobox", "checkbox", "radio", "tab", "menuitem"):
-        loc = page.get_by_role(role)
-        count = await loc.count()
-        for i in range(min(count, max_items)):
-            el = loc.nth(i)
-            try:
-                visible = await el.is_visible()
-                if not visible:
-                    continue
-                # Get display text
-                if role in ("textbox", "combobox"):
-                    name = await el.get_attribute("placeholder") or await el.get_attribute("aria-label") or ""
-                    value = await el.input_value() if role == "textbox" else ""
-                    entry = f'- [{role}] "{name}"'
-                    if value:
-                        entry += f' (value: "{value[:50]}")'
-                else:
-                    try:
-                        name = (await el.inner_text()).strip()[:80]
-                    except Exception:
-                        name = await el.get_attribute("aria-label") or ""
-                    if not name:
-                        continue
-                    entry = f'- [{role}] "{name}"'
-
-                # Check state
-                if role in ("checkbox", "radio"):
-                    checked = await el.is_checked()
-                    entry += f" ({'checked' if checked else 'unchecked'})"
-                elif role == "tab":
-                    selected = await el.get_attribute("aria-selected")
-                    if selected == "true":
-                        entry += " (active)"
-
-                lines.append(entry)
-            except Exception:
-                continue
-
+    return lines
+
+
+def _forms_section(forms: list[DetectedForm]) -> list[str]:
+    if not forms:
+        return ["FORMS: None visible", ""]
+    lines = ["FORMS:"]
+    for j, form in enumerate(forms[:3]):
+        lines.append(f"  Form {j + 1} (action: {form.action or 'N/A'}, method: {form.method}):")
+        for ff in form.fields[:10]:
+            req = " *required" if ff.required else ""
+            if ff.options:
+                lines.append(f'    - [{ff.field_type}] "{ff.label}" options: {ff.options[:5]}{req}')
+            else:
+                placeholder = f' (placeholder: "{ff.placeholder}")' if ff.placeholder else ""
+                lines.append(f'    - [{ff.field_type}] "{ff.label}"{placeholder}{req}')
+        lines.append(f'    Submit: "{form.submit_text}"')
     lines.append("")
+    return lines
 
-    # Forms
-    forms = await detect_forms(page)
-    if forms:
-        lines.append("FORMS:")
-        for j, form in enumerate(forms[:3]):
-            lines.append(f"  Form {j + 1} (action: {form.action or 'N/A'}, method: {form.method}):")
-            for ff in form.fields[:10]:
-                req = " *required" if ff.required else ""
-                if ff.options:
-                    lines.append(f'    - [{ff.field_type}] "{ff.label}" options: {ff.options[:5]}{req}')
-                else:
-                    placeholder = f' (placeholder: "{ff.placeholder}")' if ff.placeholder else ""
-                    lines.append(f'    - [{ff.field_type}] "{ff.label}"{placeholder}{req}')
-            lines.append(f'    Submit: "{form.submit_text}"')
-    else:
-        lines.append("FORMS: None visible")
-    lines.append("")
 
-    # Links summary (navigation-like)
-    all_links = await get_links(page)
-    nav_links = [l for l in all_links if not l.is_external and len(l.text) < 30][:max_items]
+def _links_section(links: list[Link], max_items: int) -> list[str]:
+    """Navigation-like links: short, same-origin."""
+    nav_links = [l for l in links if not l.is_external and len(l.text) < 30][:max_items]
+    lines = []
     if nav_links:
         lines.append("NAVIGATION: " + " | ".join(l.text for l in nav_links[:10]))
     lines.append("")
-
-    # Content snippet
-    text_content = await page.evaluate("""() => {
-        const main = document.querySelector('main, [role="main"], article, .content, #content');
-        const target = main || document.body;
-        return target.innerText?.slice(0, 500) || '';
-    }""")
-    if text_content.strip():
-        lines.append("PAGE CONTENT (preview):")
-        for line in text_content.strip().split("\n")[:8]:
-            cleaned = line.strip()
-            if cleaned:
-                lines.append(f"  {cleaned}")
-
-    return "\n".join(lines)
+    return lines
+
+
+def _content_section(text_content: str) -> list[str]:
+    if not text_content.strip():
+        return []
+    lines = ["PAGE CONTENT (preview):"]
+    for line in text_content.strip().split("\n")[:8]:
+        cleaned = line.strip()
+        if cleaned:
+            lines.append(f"  {cleaned}")
+    return lines
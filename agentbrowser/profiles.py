@@ -9,6 +9,13 @@ from .storage import Storage
 if TYPE_CHECKING:
     from playwright.async_api import BrowserContext, Page
 
+# Restores both storages in one call; keys and values arrive as an argument,
+# so nothing is spliced into the script.
+_WRITE_STORAGE_JS = """({ ls, ss }) => {
+    for (const [key, value] of Object.entries(ls)) localStorage.setItem(key, value);
+    for (const [key, value] of Object.entries(ss)) sessionStorage.setItem(key, value);
+}"""
+
 
 async def save_context_profile(
     context: BrowserContext,
@@ -18,33 +25,31 @@ async def save_context_profile(
 ) -> None:
     """Save the current browser context as a named profile.
 
-    Captures cookies, localStorage, and sessionStorage.
+    Captures cookies and localStorage for every origin in the context, in
+    Playwright's storage_state format. sessionStorage is per-tab and isn't
+    kept.
     """
-    cookies = await context.cookies()
-
-    # Extract storage from the page
-    storages = await page.evaluate("""() => {
-        const ls = {};
-        for (let i = 0; i < localStorage.length; i++) {
-            const key = localStorage.key(i);
-            ls[key] = localStorage.getItem(key);
-        }
-        const ss = {};
-        for (let i = 0; i < sessionStorage.length; i++) {
-            const key = sessionStorage.key(i);
-            ss[key] = sessionStorage.getItem(key);
-        }
-        return { localStorage: ls, sessionStorage: ss };
-    }""")
-
+    state = await context.storage_state()
     storage.save_profile(
         name=name,
-        cookies=cookies,
-        local_storage=storages.get("localStorage", {}),
-        session_storage=storages.get("sessionStorage", {}),
+        cookies=state["cookies"],
+        local_storage=state["origins"],
     )
 
 
+def profile_storage_state(name: str, storage: Storage) -> dict[str, Any] | None:
+    """A saved profile as a storage_state for creating a context.
+
+    Returns None if the profile doesn't exist or predates the storage_state
+    format (its localStorage isn't tied to an origin); load those with
+    load_context_profile once a page is open.
+    """
+    profile = storage.load_profile(name)
+    if profile is None or not isinstance(profile["local_storage"], list):
+        return None
+    return {"cookies": profile["cookies"], "origins": profile["local_storage"]}
+
+
 async def load_context_profile(
     context: BrowserContext,
     page: Page,
@@ -53,6 +58,10 @@ async def load_context_profile(
 ) -> bool:
     """Load a saved profile into the browser context.
 
+    Cookies are restored for every domain. localStorage can only be written
+    for the origin the page is currently on; for the rest, create the context
+    from profile_storage_state instead.
+
     Returns True if profile was found and loaded, False otherwise.
     """
     profile = storage.load_profile(name)
@@ -64,12 +73,22 @@ async def load_context_profile(
     if cookies:
         await context.add_cookies(cookies)
 
-    # Restore localStorage (requires a page)
-    local_storage: dict[str, str] = profile.get("local_storage", {})
-    if local_storage:
-        for key, value in local_storage.items():
-            await page.evaluate(
-                f"localStorage.setItem({key!r}, {value!r})"
-            )
+    # Restore storage (requires a page)
+    saved = profile.get("local_storage", {})
+    if isinstance(saved, list):
+        origin = await page.evaluate("window.location.origin")
+        local_storage = {
+            item["name"]: item["value"]
+            for entry in saved
+            if entry["origin"] == origin
+            for item in entry["localStorage"]
+        }
+        session_storage: dict[str, str] = {}
+    else:
+        # Older profiles: one page's localStorage and sessionStorage
+        local_storage = saved
+        session_storage = profile.get("session_storage", {})
+    if local_storage or session_storage:
+        await page.evaluate(_WRITE_STORAGE_JS, {"ls": local_storage, "ss": session_storage})
 
     return True
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import time
+from array import array
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from .storage import Storage
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordedAction:
     """A single recorded action."""
 
@@ -30,7 +32,12 @@ class ActionRecorder:
 
     def __init__(self) -> None:
         self._recording: bool = False
-        self._actions: list[RecordedAction] = []
+        # Parallel columns (action, args, seconds since start); RecordedAction
+        # objects are only built when the recording is read back, keeping
+        # record() cheap and timestamps unboxed.
+        self._names: list[str] = []
+        self._args: list[dict[str, Any]] = []
+        self._ts: array[float] = array("d")
         self._start_time: float = 0.0
 
     @property
@@ -39,44 +46,56 @@ class ActionRecorder:
 
     @property
     def actions(self) -> list[RecordedAction]:
-        return list(self._actions)
+        return [
+            RecordedAction(action=a, args=kw, timestamp=ts)
+            for a, kw, ts in zip(self._names, self._args, self._ts)
+        ]
 
     def start(self) -> None:
         """Start recording actions."""
         self._recording = True
-        self._actions = []
-        self._start_time = time.time()
+        self._names = []
+        self._args = []
+        self._ts = array("d")
+        # Monotonic, so offsets are immune to wall-clock adjustments
+        self._start_time = time.monotonic()
 
     def stop(self) -> list[RecordedAction]:
         """Stop recording and return the recorded actions."""
         self._recording = False
-        return list(self._actions)
+        return self.actions
 
     def record(self, action: str, **kwargs: Any) -> None:
         """Record a single action (called internally by BrowserAgent)."""
         if not self._recording:
             return
-        self._actions.append(
-            RecordedAction(
-                action=action,
-                args=kwargs,
-                timestamp=time.time() - self._start_time,
-            )
-        )
+        self._names.append(action)
+        self._args.append(kwargs)
+        self._ts.append(time.monotonic() - self._start_time)
 
     def save(self, name: str, storage: Storage, description: str = "") -> None:
         """Save the current recording to storage."""
         storage.save_recording(
             name=name,
-            actions=[a.to_dict() for a in self._actions],
+            actions=(
+                {"action": a, "args": kw, "timestamp": ts}
+                for a, kw, ts in zip(self._names, self._args, self._ts)
+            ),
             description=description,
         )
 
     @staticmethod
     def load(name: str, storage: Storage) -> list[RecordedAction]:
         """Load a recording from storage."""
-        raw = storage.load_recording(name)
-        if raw is None:
+        return list(ActionRecorder.stream(name, storage))
+
+    @staticmethod
+    def stream(name: str, storage: Storage) -> Iterator[RecordedAction]:
+        """Iterate over a stored recording, reading actions as they're consumed.
+
+        Raises RecordingError straight away if the recording doesn't exist.
+        """
+        if not storage.has_recording(name):
             from .exceptions import RecordingError
             raise RecordingError(f"Recording '{name}' not found")
-        return [RecordedAction.from_dict(a) for a in raw]
+        return map(RecordedAction.from_dict, storage.iter_recording(name))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,6 +13,22 @@ from .config import RetryConfig
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
+# b64encode holds the GIL, so a worker thread wouldn't free the event loop.
+# Large images are encoded in pieces instead, yielding in between; the size is
+# a multiple of 3 so the pieces concatenate into one valid encoding.
+_ENCODE_CHUNK = 3 << 20
+
+
+async def _b64encode(raw: bytes) -> str:
+    if len(raw) <= _ENCODE_CHUNK:
+        return base64.b64encode(raw).decode("ascii")
+    view = memoryview(raw)
+    parts = []
+    for start in range(0, len(raw), _ENCODE_CHUNK):
+        parts.append(base64.b64encode(view[start:start + _ENCODE_CHUNK]).decode("ascii"))
+        await asyncio.sleep(0)
+    return "".join(parts)
+
 
 async def take_screenshot(
     page: Page,
@@ -21,6 +38,7 @@ async def take_screenshot(
     element_query: str | None = None,
     quality: int | None = None,
     retry: RetryConfig | None = None,
+    encode: bool = True,
 ) -> str:
     """Take a screenshot and return as base64 string.
 
@@ -31,14 +49,22 @@ async def take_screenshot(
         element_query: If provided, screenshot only this element.
         quality: JPEG quality (1-100). Only applies to JPEG format.
         retry: Retry config for element finding.
+        encode: Base64-encode the image for the return value. Pass False
+            with a path to only write the file.
 
     Returns:
-        Base64-encoded screenshot data.
+        Base64-encoded screenshot data, or "" when encode is False.
     """
     kwargs: dict = {}
     if quality is not None:
         kwargs["quality"] = quality
         kwargs["type"] = "jpeg"
+    if path:
+        # Playwright writes the file (creating parent directories) and picks
+        # the format from the extension; anything else stays PNG as before.
+        kwargs["path"] = str(path)
+        if "type" not in kwargs and Path(path).suffix.lower() not in (".png", ".jpg", ".jpeg"):
+            kwargs["type"] = "png"
 
     if element_query and retry:
         el = await find_element(page, element_query, retry)
@@ -48,9 +74,6 @@ async def take_screenshot(
     else:
         raw = await page.screenshot(**kwargs)
 
-    if path:
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_bytes(raw)
-
-    return base64.b64encode(raw).decode("ascii")
+    if not encode:
+        return ""
+    return await _b64encode(raw)
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 _stealth = Stealth()
 
+# Module-local generator for all stealth randomness; nothing here needs to be
+# reproducible or share state with callers' use of the global random module.
+_rng = random.Random()
+
 # Realistic user agents (Chrome on various platforms)
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -27,7 +31,7 @@ USER_AGENTS = [
 
 def random_user_agent() -> str:
     """Pick a random realistic user agent string."""
-    return random.choice(USER_AGENTS)
+    return _rng.choice(USER_AGENTS)
 
 
 async def apply_stealth(page: Page) -> None:
@@ -45,26 +49,38 @@ async def apply_context_stealth(context: BrowserContext) -> None:
 
 
 async def random_delay(config: StealthConfig) -> None:
-    """Wait a random human-like delay between actions."""
+    """Wait a random human-like delay between actions.
+
+    Hot paths check ``config.enabled`` before calling, so disabled stealth
+    doesn't even create the coroutine; the check here covers other callers.
+    """
     if not config.enabled:
         return
-    delay_ms = random.randint(config.random_delay_min_ms, config.random_delay_max_ms)
+    delay_ms = _rng.randint(config.random_delay_min_ms, config.random_delay_max_ms)
     await asyncio.sleep(delay_ms / 1000.0)
 
 
 async def human_type(page: Page, selector: str, text: str, config: StealthConfig) -> None:
-    """Type text with realistic per-keystroke delays."""
-    for char in text:
-        await page.type(selector, char, delay=0)
-        if config.realistic_typing:
-            delay = random.randint(config.typing_delay_min_ms, config.typing_delay_max_ms)
-            await asyncio.sleep(delay / 1000.0)
+    """Type text with realistic per-keystroke delays.
+
+    The driver paces the keystrokes; each burst of config.typing_burst_chars
+    characters gets its own random delay, so the rhythm still varies along
+    the text without a Python round-trip per character.
+    """
+    locator = page.locator(selector)
+    if not config.realistic_typing:
+        await locator.press_sequentially(text)
+        return
+    burst = max(1, config.typing_burst_chars)
+    for i in range(0, len(text), burst):
+        delay = _rng.randint(config.typing_delay_min_ms, config.typing_delay_max_ms)
+        await locator.press_sequentially(text[i : i + burst], delay=delay)
 
 
 async def jitter_mouse(page: Page, x: int, y: int, config: StealthConfig) -> None:
     """Move mouse to position with slight random jitter."""
     if config.mouse_jitter:
         jitter = config.mouse_jitter_px
-        x += random.randint(-jitter, jitter)
-        y += random.randint(-jitter, jitter)
-    await page.mouse.move(x, y, steps=random.randint(5, 15))
+        x += _rng.randint(-jitter, jitter)
+        y += _rng.randint(-jitter, jitter)
+    await page.mouse.move(x, y, steps=_rng.randint(5, 15))
@@ -2,11 +2,53 @@
 
 from __future__ import annotations
 
-import json
-import sqlite3
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# orjson comes with the optional "fast" extra; stdlib json otherwise.
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+# Payloads above this size are stored zlib-compressed as a BLOB; smaller ones
+# stay plain JSON text. SQLite columns accept either, so no migration is
+# needed and older rows still load.
+_COMPRESS_OVER = 4096
+
+
+def _pack(value: Any) -> str | bytes:
+    """Serialize a value for a JSON column."""
+    data = _dumps(value)
+    if len(data) > _COMPRESS_OVER:
+        return zlib.compress(data, 6)
+    return data.decode()
+
+
+def _unpack(data: str | bytes) -> Any:
+    """Inverse of _pack."""
+    if isinstance(data, bytes):
+        data = zlib.decompress(data)
+    return _loads(data)
 
 
 class Storage:
@@ -15,16 +57,50 @@ class Storage:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn: sqlite3.Connection | None = None
+        # sqlite3 connections can't be shared between threads, so each thread
+        # gets its own; WAL lets their reads run alongside one writer.
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._tables_ready = False
 
     @property
     def conn(self) -> sqlite3.Connection:
-        if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
-            self._conn.execute("PRAGMA journal_mode=WAL")
-            self._init_tables()
-        return self._conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        import sqlite3  # deferred: only needed once the database is used
+
+        # check_same_thread is off only so close() can reach every thread's
+        # connection; each one is still used by a single thread.
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints; a crash can lose the
+        # last commits but never corrupts the database.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        self._local.conn = conn
+        self._local.in_txn = False
+        with self._lock:
+            self._conns.append(conn)
+            if not self._tables_ready:
+                self._init_tables()
+                self._tables_ready = True
+        return conn
+
+    @property
+    def _in_txn(self) -> bool:
+        return getattr(self._local, "in_txn", False)
+
+    @_in_txn.setter
+    def _in_txn(self, value: bool) -> None:
+        self._local.in_txn = value
 
     def _init_tables(self) -> None:
         self.conn.executescript("""
@@ -42,9 +118,46 @@ class Storage:
                 created_at TEXT NOT NULL,
                 description TEXT DEFAULT ''
             );
+            CREATE INDEX IF NOT EXISTS idx_rec_created ON recordings(created_at);
+            -- One row per recorded action; recordings.actions is only read
+            -- for recordings saved before this table existed.
+            CREATE TABLE IF NOT EXISTS recording_actions (
+                recording_name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                args TEXT NOT NULL DEFAULT '{}',
+                timestamp REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (recording_name, seq)
+            ) WITHOUT ROWID;
         """)
         self.conn.commit()
 
+    @contextmanager
+    def batch(self) -> Iterator[Storage]:
+        """Group several writes into one transaction.
+
+        Saves and deletes inside the block skip their own commit; everything
+        is committed when the block exits, or rolled back on an exception.
+        """
+        if self._in_txn:
+            yield self
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._in_txn = True
+        try:
+            yield self
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_txn = False
+
+    def _commit(self) -> None:
+        if not self._in_txn:
+            self.conn.commit()
+
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
@@ -54,10 +167,14 @@ class Storage:
         self,
         name: str,
         cookies: list[dict[str, Any]],
-        local_storage: dict[str, str] | None = None,
+        local_storage: dict[str, str] | list[dict[str, Any]] | None = None,
         session_storage: dict[str, str] | None = None,
     ) -> None:
-        """Save or update a browser profile."""
+        """Save or update a browser profile.
+
+        local_storage is either Playwright storage_state "origins" or, in
+        profiles saved by older versions, one page's key/value pairs.
+        """
         now = self._now()
         self.conn.execute(
             """INSERT INTO profiles (name, cookies, local_storage, session_storage, created_at, updated_at)
@@ -69,85 +186,137 @@ class Storage:
                  updated_at=excluded.updated_at""",
             (
                 name,
-                json.dumps(cookies),
-                json.dumps(local_storage or {}),
-                json.dumps(session_storage or {}),
+                _pack(cookies),
+                _pack(local_storage if local_storage is not None else {}),
+                _pack(session_storage or {}),
                 now,
                 now,
             ),
         )
-        self.conn.commit()
+        self._commit()
 
     def load_profile(self, name: str) -> dict[str, Any] | None:
         """Load a profile by name. Returns None if not found."""
         row = self.conn.execute(
-            "SELECT * FROM profiles WHERE name = ?", (name,)
+            """SELECT name, cookies, local_storage, session_storage, created_at, updated_at
+               FROM profiles WHERE name = ?""",
+            (name,),
         ).fetchone()
         if row is None:
             return None
+        name, cookies, local_storage, session_storage, created_at, updated_at = row
         return {
-            "name": row["name"],
-            "cookies": json.loads(row["cookies"]),
-            "local_storage": json.loads(row["local_storage"]),
-            "session_storage": json.loads(row["session_storage"]),
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
+            "name": name,
+            "cookies": _unpack(cookies),
+            "local_storage": _unpack(local_storage),
+            "session_storage": _unpack(session_storage),
+            "created_at": created_at,
+            "updated_at": updated_at,
         }
 
+    def load_profile_meta(self, name: str) -> dict[str, str] | None:
+        """Load a profile's name and timestamps, without its stored data."""
+        row = self.conn.execute(
+            "SELECT name, created_at, updated_at FROM profiles WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        name, created_at, updated_at = row
+        return {"name": name, "created_at": created_at, "updated_at": updated_at}
+
     def list_profiles(self) -> list[dict[str, str]]:
         """List all profiles."""
         rows = self.conn.execute(
             "SELECT name, created_at, updated_at FROM profiles ORDER BY name"
         ).fetchall()
-        return [dict(r) for r in rows]
+        return [{"name": n, "created_at": c, "updated_at": u} for n, c, u in rows]
 
     def delete_profile(self, name: str) -> bool:
         """Delete a profile. Returns True if it existed."""
         cur = self.conn.execute("DELETE FROM profiles WHERE name = ?", (name,))
-        self.conn.commit()
+        self._commit()
         return cur.rowcount > 0
 
     # --- Recordings ---
 
     def save_recording(
-        self, name: str, actions: list[dict[str, Any]], description: str = ""
+        self, name: str, actions: Iterable[dict[str, Any]], description: str = ""
     ) -> None:
-        """Save a recorded action sequence."""
+        """Save a recorded action sequence.
+
+        actions may be any iterable (e.g. a generator); rows are inserted as
+        it is consumed, in a single transaction.
+        """
         now = self._now()
-        self.conn.execute(
-            """INSERT INTO recordings (name, actions, created_at, description)
-               VALUES (?, ?, ?, ?)
-               ON CONFLICT(name) DO UPDATE SET
-                 actions=excluded.actions,
-                 description=excluded.description""",
-            (name, json.dumps(actions), now, description),
-        )
-        self.conn.commit()
+        with self.batch():
+            self.conn.execute(
+                """INSERT INTO recordings (name, actions, created_at, description)
+                   VALUES (?, '[]', ?, ?)
+                   ON CONFLICT(name) DO UPDATE SET
+                     actions='[]',
+                     description=excluded.description""",
+                (name, now, description),
+            )
+            self.conn.execute("DELETE FROM recording_actions WHERE recording_name = ?", (name,))
+            self.conn.executemany(
+                "INSERT INTO recording_actions VALUES (?, ?, ?, ?, ?)",
+                (
+                    (name, seq, a["action"], _pack(a.get("args", {})), a.get("timestamp", 0.0))
+                    for seq, a in enumerate(actions)
+                ),
+            )
+
+    def has_recording(self, name: str) -> bool:
+        """Whether a recording with this name exists."""
+        row = self.conn.execute("SELECT 1 FROM recordings WHERE name = ?", (name,)).fetchone()
+        return row is not None
 
     def load_recording(self, name: str) -> list[dict[str, Any]] | None:
         """Load a recording by name."""
+        if not self.has_recording(name):
+            return None
+        return list(self.iter_recording(name))
+
+    def iter_recording(self, name: str) -> Iterator[dict[str, Any]]:
+        """Yield a recording's actions in order without loading them all at once."""
+        cur = self.conn.execute(
+            """SELECT action, args, timestamp FROM recording_actions
+               WHERE recording_name = ? ORDER BY seq""",
+            (name,),
+        )
+        found = False
+        for action, args, ts in cur:
+            found = True
+            yield {"action": action, "args": _unpack(args), "timestamp": ts}
+        if found:
+            return
+        # Saved before recording_actions existed
         row = self.conn.execute(
             "SELECT actions FROM recordings WHERE name = ?", (name,)
         ).fetchone()
-        if row is None:
-            return None
-        return json.loads(row["actions"])
+        if row is not None:
+            yield from _unpack(row[0])
 
     def list_recordings(self) -> list[dict[str, str]]:
         """List all recordings."""
         rows = self.conn.execute(
             "SELECT name, created_at, description FROM recordings ORDER BY name"
         ).fetchall()
-        return [dict(r) for r in rows]
+        return [{"name": n, "created_at": c, "description": d} for n, c, d in rows]
 
     def delete_recording(self, name: str) -> bool:
         """Delete a recording."""
-        cur = self.conn.execute("DELETE FROM recordings WHERE name = ?", (name,))
-        self.conn.commit()
+        with self.batch():
+            cur = self.conn.execute("DELETE FROM recordings WHERE name = ?", (name,))
+            self.conn.execute("DELETE FROM recording_actions WHERE recording_name = ?", (name,))
         return cur.rowcount > 0
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        """Close the database connections of every thread."""
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        # Other threads' locals still point at closed connections; a new
+        # local object makes each of them reopen on next use.
+        self._local = threading.local()
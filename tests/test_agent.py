@@ -56,6 +56,28 @@ async def test_page_summary():
         assert "VISIBLE ELEMENTS:" in summary
 
 
+@pytest.mark.asyncio
+async def test_page_summary_shadow_dom_and_listbox():
+    """Test that page_summary lists elements inside open shadow roots."""
+    async with BrowserAgent(headless=True) as agent:
+        await agent.page.set_content("""
+            <x-toolbar></x-toolbar>
+            <select aria-label="Sizes" multiple><option>S</option><option>M</option></select>
+            <select aria-label="Color"><option>Red</option></select>
+            <script>
+                customElements.define('x-toolbar', class extends HTMLElement {
+                    connectedCallback() {
+                        this.attachShadow({ mode: 'open' }).innerHTML = '<button>Shadow Save</button>';
+                    }
+                });
+            </script>
+        """)
+        summary = await agent.page_summary()
+        assert '[button] "Shadow Save"' in summary
+        assert '[listbox] "Sizes"' in summary
+        assert '[combobox] "Color"' in summary
+
+
 @pytest.mark.asyncio
 async def test_screenshot_base64():
     """Test screenshot returns base64."""
@@ -0,0 +1,58 @@
+"""Tests for configuration validation (no browser needed)."""
+
+from pathlib import Path
+
+import pytest
+from agentbrowser import BrowserAgent
+from agentbrowser.config import AgentConfig, BrowserConfig, RetryConfig, StealthConfig
+
+
+def test_unknown_browser_type():
+    """Test that an unknown browser_type is rejected before anything launches."""
+    with pytest.raises(ValueError, match="browser_type"):
+        BrowserConfig(browser_type="chrome")
+    with pytest.raises(ValueError, match="browser_type"):
+        BrowserAgent(browser_type="chrome")
+
+
+def test_values_are_coerced():
+    """Test that string and numeric inputs are converted like pydantic did."""
+    bc = BrowserConfig(headless="false", viewport_width="1280", slow_mo=5.0)
+    assert bc.headless is False
+    assert bc.viewport_width == 1280
+    assert bc.slow_mo == 5 and isinstance(bc.slow_mo, int)
+    assert RetryConfig(jitter="0.25").jitter == 0.25
+    assert StealthConfig(enabled=1).enabled is True
+
+    config = AgentConfig(data_dir="/tmp/agentbrowser-test", browser={"browser_type": "firefox"})
+    assert config.data_dir == Path("/tmp/agentbrowser-test")
+    assert config.browser == BrowserConfig(browser_type="firefox")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"viewport_width": "wide"},
+        {"timeout_ms": 1.5},
+        {"headless": "maybe"},
+        {"locale": 5},
+    ],
+)
+def test_invalid_values(kwargs):
+    """Test that values of the wrong type raise ValueError."""
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        BrowserConfig(**kwargs)
+
+
+def test_from_dict():
+    """Test building a config from parsed JSON."""
+    config = AgentConfig.from_dict(
+        {"browser": {"headless": False}, "retry": {"max_retries": "5"}, "data_dir": "/tmp/ab", "profile": None}
+    )
+    assert config.browser.headless is False
+    assert config.retry.max_retries == 5
+    assert config.data_dir == Path("/tmp/ab")
+    with pytest.raises(TypeError):
+        AgentConfig.from_dict({"browser": {"no_such_option": 1}})
+    with pytest.raises(ValueError, match="profile"):
+        AgentConfig.from_dict({"profile": 3})
@@ -1,7 +1,10 @@
 """Tests for smart element finding."""
 
+import re
+
 import pytest
 from agentbrowser import BrowserAgent, ElementNotFoundError
+from agentbrowser.elements import _css_string, _looks_like_selector, _search_plan, parse_query
 
 
 @pytest.mark.asyncio
@@ -22,3 +25,53 @@ async def test_element_not_found_error():
         with pytest.raises(ElementNotFoundError) as exc_info:
             await agent.click("Nonexistent Button XYZ")
         assert "Nonexistent Button XYZ" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["#login", ".btn", "[name=q]", "//button", "xpath=//a", "form > input", "h1 ~ p", "p::first-line"],
+)
+def test_looks_like_selector(query):
+    """Test that CSS/XPath-shaped queries are treated as selectors."""
+    assert _looks_like_selector(query)
+
+
+@pytest.mark.parametrize("query", ["Sign in", "Email", "1. Step", "Price: $5", "a>b", "Q&A"])
+def test_plain_text_is_not_selector(query):
+    """Test that ordinary text isn't mistaken for a selector."""
+    assert not _looks_like_selector(query)
+
+
+def test_search_plan():
+    """Test which find_element steps run for each kind of query."""
+    roles = ("role:button", "role:link", "role:menuitem", "role:tab", "role:option")
+    assert _search_plan("#submit") == ("css", "probe")
+    assert _search_plan("Email") == ("probe", *roles, "label", "placeholder", "text", "attr")
+    # Action words can't be field labels, whatever their case or spacing
+    assert _search_plan("Submit") == ("probe", *roles, "text", "attr")
+    assert _search_plan("  sign   IN ") == ("probe", *roles, "text", "attr")
+
+
+def test_css_string():
+    """Test that values are escaped into valid CSS string literals."""
+    assert _css_string("Search") == '"Search"'
+    assert _css_string('say "hi"') == '"say \\"hi\\""'
+    assert _css_string("a\\b") == '"a\\\\b"'
+    assert _css_string("line\nbreak") == '"line\\a break"'
+
+
+def test_parse_query():
+    """Test query classification, matching and caching."""
+    q = parse_query("Sign in")
+    assert q.value == "Sign in"
+    assert q.plan == _search_plan("Sign in")
+    assert q.matcher == "Sign in"  # already normalized: Playwright matches it as-is
+    assert q.pattern.search("please SIGN IN here")
+    assert q.attr_selector == '[title="Sign in" i], [aria-label="Sign in" i]'
+    assert parse_query("Sign in") is q
+
+    # Regex metacharacters are literal; unnormalized queries keep the pattern
+    q = parse_query(" Total (USD) ")
+    assert isinstance(q.matcher, re.Pattern)
+    assert q.pattern.search("grand total (usd) ")
+    assert not q.pattern.search("Total USD")
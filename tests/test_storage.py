@@ -0,0 +1,83 @@
+"""Tests for SQLite storage (no browser needed)."""
+
+import pytest
+from agentbrowser.recorder import ActionRecorder
+from agentbrowser.exceptions import RecordingError
+from agentbrowser.storage import Storage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    s = Storage(tmp_path / "agentbrowser.db")
+    yield s
+    s.close()
+
+
+def test_recording_round_trip(storage):
+    """Test that actions come back in order with their args."""
+    actions = [
+        {"action": "goto", "args": {"url": "https://example.com"}, "timestamp": 0.0},
+        {"action": "click", "args": {"query": "Sign in"}, "timestamp": 0.5},
+        # Large enough to be stored compressed
+        {"action": "type", "args": {"query": "Bio", "text": "x" * 10_000}, "timestamp": 1.25},
+    ]
+    storage.save_recording("login", iter(actions), "log in")
+    assert storage.load_recording("login") == actions
+    assert list(storage.iter_recording("login")) == actions
+    assert storage.list_recordings()[0]["description"] == "log in"
+
+
+def test_recording_overwrite_and_delete(storage):
+    """Test that saving again replaces the actions and delete removes them."""
+    storage.save_recording("r", [{"action": "click", "args": {"query": "a"}}] * 3)
+    storage.save_recording("r", [{"action": "hover", "args": {"query": "b"}}])
+    assert [a["action"] for a in storage.load_recording("r")] == ["hover"]
+
+    assert storage.delete_recording("r")
+    assert storage.load_recording("r") is None
+    assert not storage.delete_recording("r")
+    assert storage.conn.execute("SELECT COUNT(*) FROM recording_actions").fetchone()[0] == 0
+
+
+def test_recording_legacy_row(storage):
+    """Test that recordings saved as a single actions column still load."""
+    storage.conn.execute(
+        "INSERT INTO recordings (name, actions, created_at) VALUES (?, ?, ?)",
+        ("old", '[{"action": "goto", "args": {"url": "https://example.com"}}]', "2024-01-01"),
+    )
+    storage.conn.commit()
+    assert storage.load_recording("old") == [{"action": "goto", "args": {"url": "https://example.com"}}]
+    assert [a.action for a in ActionRecorder.load("old", storage)] == ["goto"]
+
+
+def test_recorder_save_and_stream(storage):
+    """Test that ActionRecorder recordings round-trip through storage."""
+    recorder = ActionRecorder()
+    recorder.start()
+    recorder.record("goto", url="https://example.com")
+    recorder.record("click", query="More")
+    recorder.stop()
+    recorder.save("flow", storage)
+
+    streamed = list(ActionRecorder.stream("flow", storage))
+    assert [(a.action, a.args) for a in streamed] == [
+        ("goto", {"url": "https://example.com"}),
+        ("click", {"query": "More"}),
+    ]
+    with pytest.raises(RecordingError):
+        ActionRecorder.stream("missing", storage)
+
+
+def test_batch_rollback(storage):
+    """Test that an exception inside batch() discards all of its writes."""
+    with pytest.raises(RuntimeError):
+        with storage.batch():
+            storage.save_recording("a", [{"action": "click", "args": {}}])
+            storage.save_profile("p", cookies=[], local_storage={})
+            raise RuntimeError("boom")
+    assert storage.load_recording("a") is None
+    assert storage.load_profile("p") is None
+
+    with storage.batch():
+        storage.save_recording("a", [{"action": "click", "args": {}}])
+    assert storage.load_recording("a") == [{"action": "click", "args": {}, "timestamp": 0.0}]